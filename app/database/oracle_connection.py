@@ -7,13 +7,14 @@
 import oracledb
 from sqlalchemy import create_engine, text
 from sqlalchemy.orm import sessionmaker, declarative_base
-from sqlalchemy.pool import QueuePool
-from typing import Generator, Optional, Dict, Any, List
-from contextlib import contextmanager
+from sqlalchemy.pool import NullPool
+from sqlalchemy.sql.elements import TextClause
+from typing import Callable, Generator, Iterator, Optional, Dict, Any, List
+from contextlib import contextmanager, asynccontextmanager
+from functools import lru_cache
 import logging
-import sys
-import os
-sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+import threading
+import time
 
 from config.oracle_config import settings, ORACLE_CONFIG
 
@@ -21,28 +22,91 @@ from config.oracle_config import settings, ORACLE_CONFIG
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Connection parameters are built and the DSN parsed once, at import time
+_pool_params = oracledb.PoolParams(
+    user=ORACLE_CONFIG['user'],
+    password=ORACLE_CONFIG['password'],
+    min=settings.ORACLE_POOL_SIZE,
+    max=settings.ORACLE_POOL_SIZE + settings.ORACLE_MAX_OVERFLOW,
+    increment=settings.ORACLE_POOL_INCREMENT,
+    homogeneous=True,
+    stmtcachesize=settings.ORACLE_STMT_CACHE_SIZE,
+    max_lifetime_session=settings.ORACLE_POOL_RECYCLE,
+    getmode=oracledb.POOL_GETMODE_TIMEDWAIT,
+    wait_timeout=settings.ORACLE_POOL_TIMEOUT * 1000  # milliseconds
+)
+_pool_params.parse_connect_string(ORACLE_CONFIG['dsn'])
+
+# Process-wide oracledb session pool (statement cache reuses parsed cursors),
+# opened by the first caller that needs a session rather than at import
+_pool = None
+_pool_lock = threading.Lock()
+
+def _init_session(connection, requested_tag) -> None:
+    """Prepare a newly created pooled session (runs once per physical session)"""
+    if settings.ORACLE_CURRENT_SCHEMA:
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "BEGIN EXECUTE IMMEDIATE 'ALTER SESSION SET CURRENT_SCHEMA = ' "
+                "|| DBMS_ASSERT.SIMPLE_SQL_NAME(:schema); END;",
+                schema=settings.ORACLE_CURRENT_SCHEMA
+            )
+
+def get_pool():
+    """Return the session pool, creating it on first use"""
+    global _pool
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                _pool = oracledb.create_pool(params=_pool_params, session_callback=_init_session)
+    return _pool
+
+# Rows fetched per round-trip for every new cursor; arraysize is a cursor
+# attribute, so it is set as a driver default rather than in a session callback.
+# Prefetching one extra row lets a result that fits in one batch finish in the
+# execute round-trip without a separate fetch to detect the end.
+oracledb.defaults.arraysize = settings.ORACLE_FETCH_ARRAYSIZE
+oracledb.defaults.prefetchrows = settings.ORACLE_FETCH_ARRAYSIZE + 1
+
 # SQLAlchemy Base
 Base = declarative_base()
 
+@lru_cache(maxsize=512)
+def _prepared(sql: str) -> TextClause:
+    """Return a cached TextClause for the given SQL string"""
+    return text(sql)
+
+@lru_cache(maxsize=256)
+def plsql_call_block(procedure_name: str, arg_count: int) -> str:
+    """Return a cached PL/SQL block calling a procedure with positional binds"""
+    binds = ", ".join(f":{i}" for i in range(1, arg_count + 1))
+    return f"BEGIN {procedure_name}({binds}); END;"
+
+def dict_rows(cursor, lowercase: bool = False, convert: Optional[Callable[[Dict], Dict]] = None) -> None:
+    """Make cursor return dict rows; call after execute so description is known"""
+    columns = [d[0].lower() if lowercase and d[0].isupper() else d[0] for d in cursor.description]
+    if convert is None:
+        cursor.rowfactory = lambda *row: dict(zip(columns, row))
+    else:
+        cursor.rowfactory = lambda *row: convert(dict(zip(columns, row)))
+
 class OracleConnectionManager:
     """Oracle Database Connection Manager"""
 
     def __init__(self):
         self.engine = None
         self.SessionLocal = None
+        self._last_probe = (0.0, False)  # (monotonic time, result) of last connection test
         self._initialize_engine()
 
     def _initialize_engine(self):
         """Initialize SQLAlchemy engine with Oracle database"""
         try:
-            # Create SQLAlchemy engine with connection pooling
+            # Create SQLAlchemy engine; pooling is delegated to the oracledb session pool
             self.engine = create_engine(
                 settings.oracle_url,
-                poolclass=QueuePool,
-                pool_size=settings.ORACLE_POOL_SIZE,
-                max_overflow=settings.ORACLE_MAX_OVERFLOW,
-                pool_timeout=settings.ORACLE_POOL_TIMEOUT,
-                pool_recycle=settings.ORACLE_POOL_RECYCLE,
+                poolclass=NullPool,
+                creator=lambda: get_pool().acquire(),
                 echo=settings.DEBUG,  # Log SQL queries in debug mode
                 future=True
             )
@@ -53,18 +117,17 @@ class OracleConnectionManager:
                 autoflush=False,
                 bind=self.engine
             )
+            self._make_session = self.SessionLocal
 
             logger.info("Oracle database engine initialized successfully")
 
         except Exception as e:
-            logger.error(f"Failed to initialize Oracle database engine: {e}")
+            logger.error("Failed to initialize Oracle database engine: %s", e)
             raise
 
     def get_session(self):
-        """Get SQLAlchemy database session"""
-        if not self.SessionLocal:
-            raise Exception("Database engine not initialized")
-        return self.SessionLocal()
+        """Get SQLAlchemy database session (engine init raises if it failed)"""
+        return self._make_session()
 
     @contextmanager
     def get_session_context(self):
@@ -75,69 +138,104 @@ class OracleConnectionManager:
             session.commit()
         except Exception as e:
             session.rollback()
-            logger.error(f"Database session error: {e}")
+            logger.error("Database session error: %s", e)
             raise
         finally:
             session.close()
 
-    def test_connection(self) -> bool:
-        """Test database connection"""
+    def test_connection(self, force: bool = False) -> bool:
+        """Test database connection, reusing a result younger than ORACLE_HEALTH_CHECK_TTL"""
+        now = time.monotonic()
+        checked_at, is_connected = self._last_probe
+        if not force and now - checked_at < settings.ORACLE_HEALTH_CHECK_TTL:
+            return is_connected
+
         try:
             with self.engine.connect() as connection:
                 result = connection.execute(text("SELECT 'Connection Test' FROM DUAL"))
                 test_result = result.fetchone()
-                logger.info(f"Database connection test successful: {test_result[0]}")
-                return True
+                if logger.isEnabledFor(logging.INFO):
+                    logger.info("Database connection test successful: %s", test_result[0])
+                is_connected = True
         except Exception as e:
-            logger.error(f"Database connection test failed: {e}")
-            return False
+            logger.error("Database connection test failed: %s", e)
+            is_connected = False
+
+        self._last_probe = (now, is_connected)
+        return is_connected
+
+    def acquire(self):
+        """Context manager for a pooled oracledb connection, released on exit"""
+        return DirectOracleConnection.get_connection()
 
     def execute_raw_sql(self, sql: str, params: Optional[Dict] = None) -> List[Dict]:
         """Execute raw SQL query and return results"""
         try:
             with self.engine.connect() as connection:
-                result = connection.execute(text(sql), params or {})
-                if result.returns_rows:
-                    columns = result.keys()
-                    rows = result.fetchall()
-                    return [dict(zip(columns, row)) for row in rows]
-                else:
-                    return [{"affected_rows": result.rowcount}]
+                return self._fetch_rows(connection, sql, params)
         except Exception as e:
-            logger.error(f"Error executing raw SQL: {e}")
+            logger.error("Error executing raw SQL: %s", e)
             raise
 
+    def iter_raw_sql(self, sql: str, params: Optional[Dict] = None, arraysize: Optional[int] = None) -> Iterator[Dict]:
+        """Yield query rows (keyed like execute_raw_sql) as they are fetched"""
+        arraysize = arraysize or settings.ORACLE_FETCH_ARRAYSIZE
+        with self.acquire() as connection:
+            with connection.cursor() as cursor:
+                cursor.arraysize = arraysize
+                cursor.prefetchrows = arraysize
+                cursor.execute(sql, params or {})
+                dict_rows(cursor, lowercase=True)
+                yield from cursor
+
+    @staticmethod
+    def _fetch_rows(connection, sql: str, params: Optional[Dict] = None) -> List[Dict]:
+        """Run a statement on an open connection and materialize the result"""
+        result = connection.execute(_prepared(sql), params or {})
+        if result.returns_rows:
+            return [dict(row) for row in result.mappings()]
+        else:
+            return [{"affected_rows": result.rowcount}]
+
     def call_procedure(self, procedure_name: str, params: Optional[Dict] = None) -> Any:
         """Call Oracle stored procedure"""
         try:
-            with self.get_session_context() as session:
-                # Prepare procedure call
-                param_list = []
-                if params:
-                    for key, value in params.items():
-                        param_list.append(f":{key}")
-
-                sql = f"CALL {procedure_name}({', '.join(param_list)})"
-                result = session.execute(text(sql), params or {})
-                return result.fetchall() if result.returns_rows else None
+            with self.acquire() as connection:
+                cursor = connection.cursor()
+                try:
+                    # Same positional call callproc makes, with the block text memoized
+                    args = list(params.values()) if params else []
+                    cursor.execute(plsql_call_block(procedure_name, len(args)), args)
+                    connection.commit()
+                    return [arg.getvalue() if isinstance(arg, oracledb.Var) else arg for arg in args]
+                finally:
+                    cursor.close()
 
         except Exception as e:
-            logger.error(f"Error calling procedure {procedure_name}: {e}")
+            logger.error("Error calling procedure %s: %s", procedure_name, e)
             raise
 
     def close(self):
         """Close database engine"""
+        global _pool
         if self.engine:
             self.engine.dispose()
             logger.info("Database engine closed")
+        if _pool is not None:
+            _pool.close(force=True)
+            _pool = None
+            logger.info("Oracle session pool closed")
 
 # Global connection manager instance
 connection_manager = OracleConnectionManager()
 
+# Session factory bound once so the request dependency makes a single call
+session_factory = connection_manager._make_session
+
 # Dependency for FastAPI
 def get_database_session() -> Generator:
     """Dependency to get database session for FastAPI routes"""
-    session = connection_manager.get_session()
+    session = session_factory()
     try:
         yield session
     finally:
@@ -150,19 +248,19 @@ class DirectOracleConnection:
     @staticmethod
     @contextmanager
     def get_connection():
-        """Context manager for direct Oracle connections"""
+        """Context manager for pooled Oracle connections"""
         connection = None
         try:
-            connection = oracledb.connect(**ORACLE_CONFIG)
+            connection = get_pool().acquire()
             yield connection
         except Exception as e:
             if connection:
                 connection.rollback()
-            logger.error(f"Direct Oracle connection error: {e}")
+            logger.error("Direct Oracle connection error: %s", e)
             raise
         finally:
             if connection:
-                connection.close()
+                get_pool().release(connection)
 
     @staticmethod
     def execute_procedure_with_cursor(procedure_name: str, params: Optional[Dict] = None):
@@ -170,8 +268,11 @@ class DirectOracleConnection:
         with DirectOracleConnection.get_connection() as connection:
             cursor = connection.cursor()
             try:
-                # Create output cursor for procedures that return cursors
+                # Create output cursor for procedures that return cursors;
+                # fetch sizes must be set before the procedure opens it
                 output_cursor = connection.cursor()
+                output_cursor.arraysize = settings.ORACLE_FETCH_ARRAYSIZE
+                output_cursor.prefetchrows = settings.ORACLE_FETCH_ARRAYSIZE + 1
 
                 # Prepare parameters including output cursor
                 call_params = list(params.values()) if params else []
@@ -180,20 +281,105 @@ class DirectOracleConnection:
                 # Execute procedure
                 cursor.callproc(procedure_name, call_params)
 
-                # Fetch results from output cursor
-                results = []
-                for row in output_cursor:
-                    results.append(row)
+                # Fetch results from output cursor in arraysize batches
+                results = output_cursor.fetchall()
 
                 output_cursor.close()
                 return results
 
             except Exception as e:
-                logger.error(f"Error executing procedure with cursor: {e}")
+                logger.error("Error executing procedure with cursor: %s", e)
+                raise
+            finally:
+                cursor.close()
+
+    @staticmethod
+    def execute_procedure_many(procedure_name: str, rows: List[List[Any]], batch_size: int = 1000) -> List[Any]:
+        """Execute an insert procedure once per row with array binds; return each row's OUT id"""
+        results = []
+        if not rows:
+            return results
+        block = plsql_call_block(procedure_name, len(rows[0]) + 1)
+        with DirectOracleConnection.get_connection() as connection:
+            cursor = connection.cursor()
+            try:
+                for start in range(0, len(rows), batch_size):
+                    batch = rows[start:start + batch_size]
+                    # Trailing OUT parameter collected for every row of the batch
+                    out_ids = cursor.var(oracledb.DB_TYPE_NUMBER, arraysize=len(batch))
+                    cursor.setinputsizes(*([None] * len(rows[0])), out_ids)
+                    cursor.executemany(block, batch)
+                    results.extend(out_ids.values)
+                connection.commit()
+                return results
+
+            except Exception as e:
+                logger.error("Error executing procedure %s in batch: %s", procedure_name, e)
                 raise
             finally:
                 cursor.close()
 
+# Async Oracle connection utility (native asyncio driver, no threadpool hop)
+class AsyncOracleConnection:
+    """Async Oracle connections using oracledb's asyncio pool"""
+
+    _pool = None
+
+    @classmethod
+    def get_pool(cls):
+        """Create the async session pool on first use (needs a running event loop)"""
+        if cls._pool is None:
+            cls._pool = oracledb.create_pool_async(params=_pool_params)
+        return cls._pool
+
+    @classmethod
+    @asynccontextmanager
+    async def get_connection(cls):
+        """Async context manager for pooled Oracle connections"""
+        async with cls.get_pool().acquire() as connection:
+            # Same schema setup as the sync pool's _init_session; the driver sends
+            # it with the next round-trip, so it costs no extra call
+            schema = settings.ORACLE_CURRENT_SCHEMA
+            if schema and connection.current_schema != schema:
+                connection.current_schema = schema
+            yield connection
+
+    @classmethod
+    async def execute_raw_sql(cls, sql: str, params: Optional[Dict] = None) -> List[Dict]:
+        """Execute a query and return rows keyed like execute_raw_sql (lowercased names)"""
+        try:
+            async with cls.get_connection() as connection:
+                with connection.cursor() as cursor:
+                    await cursor.execute(sql, params or {})
+                    dict_rows(cursor, lowercase=True)
+                    return await cursor.fetchall()
+        except Exception as e:
+            logger.error("Error executing async SQL: %s", e)
+            raise
+
+    @classmethod
+    async def execute_cursor_call(cls, call_sql: str, params: List[Any]) -> List[Dict]:
+        """Run a procedure call block whose trailing OUT bind is a REF CURSOR and fetch its rows"""
+        try:
+            async with cls.get_connection() as connection:
+                with connection.cursor() as cursor, connection.cursor() as result_cursor:
+                    result_cursor.arraysize = settings.ORACLE_FETCH_ARRAYSIZE
+                    result_cursor.prefetchrows = settings.ORACLE_FETCH_ARRAYSIZE + 1
+                    await cursor.execute(call_sql, [*params, result_cursor])
+                    dict_rows(result_cursor)
+                    return await result_cursor.fetchall()
+        except Exception as e:
+            logger.error("Error executing async procedure call %s: %s", call_sql, e)
+            raise
+
+    @classmethod
+    async def close(cls):
+        """Close the async session pool"""
+        if cls._pool is not None:
+            await cls._pool.close(force=True)
+            cls._pool = None
+            logger.info("Async Oracle session pool closed")
+
 # Utility functions
 def create_tables():
     """Create all tables defined in models"""
@@ -201,7 +387,7 @@ def create_tables():
         Base.metadata.create_all(bind=connection_manager.engine)
         logger.info("Database tables created successfully")
     except Exception as e:
-        logger.error(f"Error creating tables: {e}")
+        logger.error("Error creating tables: %s", e)
         raise
 
 def drop_tables():
@@ -210,7 +396,7 @@ def drop_tables():
         Base.metadata.drop_all(bind=connection_manager.engine)
         logger.info("Database tables dropped successfully")
     except Exception as e:
-        logger.error(f"Error dropping tables: {e}")
+        logger.error("Error dropping tables: %s", e)
         raise
 
 def init_database():
@@ -218,7 +404,7 @@ def init_database():
     logger.info("Initializing Census database...")
 
     # Test connection first
-    if not connection_manager.test_connection():
+    if not connection_manager.test_connection(force=True):
         raise Exception("Cannot connect to Oracle database")
 
     # Note: Tables are created via SQL scripts, not SQLAlchemy
@@ -238,19 +424,19 @@ if __name__ == "__main__":
 
         # Test raw SQL execution
         result = connection_manager.execute_raw_sql("SELECT SYSDATE FROM DUAL")
-        logger.info(f"Current database time: {result}")
+        logger.info("Current database time: %s", result)
 
         # Test direct connection
         with DirectOracleConnection.get_connection() as conn:
             cursor = conn.cursor()
             cursor.execute("SELECT USER FROM DUAL")
             user = cursor.fetchone()[0]
-            logger.info(f"Connected as user: {user}")
+            logger.info("Connected as user: %s", user)
             cursor.close()
 
         logger.info("All database tests passed!")
 
     except Exception as e:
-        logger.error(f"Database test failed: {e}")
+        logger.error("Database test failed: %s", e)
     finally:
         connection_manager.close()
@@ -11,13 +11,10 @@ import uvicorn
 import logging
 from contextlib import asynccontextmanager
 
-# Import configuration and routes
-import sys
-import os
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
+# Import configuration and routes (install the project with `pip install -e .`)
 from config.oracle_config import settings
 from app.routes.census_routes import router as census_router
+from app.utils.orjson_response import ORJSONResponse
 
 # Configure logging
 logging.basicConfig(
@@ -31,28 +28,32 @@ async def lifespan(app: FastAPI):
     """Application lifespan events"""
     # Startup
     logger.info("Starting Census Database Management System...")
-    logger.info(f"Debug mode: {settings.DEBUG}")
+    logger.info("Debug mode: %s", settings.DEBUG)
 
     # Test database connection
     try:
         from app.database.oracle_connection import connection_manager
-        if connection_manager.test_connection():
+        if connection_manager.test_connection(force=True):
             logger.info("✅ Database connection successful")
         else:
             logger.error("❌ Database connection failed")
     except Exception as e:
-        logger.error(f"❌ Database connection error: {e}")
+        logger.error("❌ Database connection error: %s", e)
 
     yield
 
     # Shutdown
     logger.info("Shutting down Census Database Management System...")
     try:
-        from app.database.oracle_connection import connection_manager
+        from app.database.oracle_connection import connection_manager, AsyncOracleConnection
         connection_manager.close()
+        await AsyncOracleConnection.close()
+        from app.utils import cache, result_cache
+        await cache.close()
+        result_cache.close()
         logger.info("✅ Database connections closed")
     except Exception as e:
-        logger.error(f"Error closing database connections: {e}")
+        logger.error("Error closing database connections: %s", e)
 
 # Create FastAPI application
 app = FastAPI(
@@ -87,6 +88,7 @@ app = FastAPI(
     * Comprehensive data validation and constraints
     """,
     version=settings.APP_VERSION,
+    default_response_class=ORJSONResponse,
     docs_url="/docs",
     redoc_url="/redoc",
     lifespan=lifespan
@@ -95,10 +97,11 @@ app = FastAPI(
 # Add CORS middleware
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],  # In production, specify allowed origins
+    allow_origins=list(settings.ALLOWED_ORIGINS),  # Exact origins, configured via .env
     allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_methods=["GET", "POST", "PUT", "DELETE", "PATCH"],
+    allow_headers=["authorization", "content-type", "if-none-match"],
+    expose_headers=["ETag"],  # Lets browser clients send conditional GETs
 )
 
 # Include routers
@@ -138,20 +141,19 @@ async def get_system_info():
 # Custom exception handlers
 @app.exception_handler(404)
 async def not_found_handler(request, exc):
-    return {
+    return ORJSONResponse({
         "success": False,
         "message": "Endpoint not found",
-        "detail": "The requested resource was not found"
-    }
+        "detail": getattr(exc, "detail", "The requested resource was not found")
+    }, status_code=404)
 
-@app.exception_handler(500)
+@app.exception_handler(Exception)
 async def internal_error_handler(request, exc):
-    logger.error(f"Internal server error: {exc}")
-    return {
+    logger.exception("Unhandled error on %s %s", request.method, request.url.path)
+    return ORJSONResponse({
         "success": False,
-        "message": "Internal server error",
-        "detail": "An unexpected error occurred"
-    }
+        "message": str(exc)
+    }, status_code=500)
 
 def run_server():
     """Run the FastAPI server"""
@@ -160,6 +162,13 @@ def run_server():
         host=settings.API_HOST,
         port=settings.API_PORT,
         reload=settings.API_RELOAD,
+        workers=None if settings.API_RELOAD else settings.API_WORKERS,
+        loop=settings.API_LOOP,
+        http=settings.API_HTTP,
+        backlog=settings.API_BACKLOG,
+        limit_concurrency=settings.API_LIMIT_CONCURRENCY,
+        timeout_keep_alive=settings.API_KEEPALIVE_TIMEOUT,
+        access_log=settings.DEBUG,  # Skip the per-request access log write in production
         log_level="info" if settings.DEBUG else "warning"
     )
 
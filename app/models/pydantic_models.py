@@ -4,7 +4,8 @@
 # Created: 2025-07-23 10:31:12
 # =========================================
 
-from pydantic import BaseModel, Field, validator
+from pydantic import BaseModel, ConfigDict, Field, ValidationInfo, computed_field, field_validator
+from functools import cached_property
 from typing import Optional, List
 from datetime import date, datetime
 from enum import Enum
@@ -34,6 +35,11 @@ class YesNo(str, Enum):
 # BASE MODELS
 # =========================================
 
+# Create/Update payloads: store enum members as their plain values and
+# stay immutable once validated
+WRITE_MODEL_CONFIG = ConfigDict(use_enum_values=True, validate_default=True, frozen=True,
+                                extra="ignore", validate_assignment=False)
+
 class BaseModelWithId(BaseModel):
     """Base model with common fields"""
     date_created: Optional[datetime] = None
@@ -41,9 +47,7 @@ class BaseModelWithId(BaseModel):
     created_by: Optional[str] = None
     modified_by: Optional[str] = None
 
-    class Config:
-        from_attributes = True
-        use_enum_values = True
+    model_config = ConfigDict(from_attributes=True, extra="ignore")
 
 # =========================================
 # GEOGRAPHICAL INFORMATION MODELS
@@ -67,10 +71,12 @@ class GeographicalInfoBase(BaseModel):
 
 class GeographicalInfoCreate(GeographicalInfoBase):
     """Model for creating geographical information"""
-    pass
+    model_config = WRITE_MODEL_CONFIG
 
 class GeographicalInfoUpdate(BaseModel):
     """Model for updating geographical information"""
+    model_config = WRITE_MODEL_CONFIG
+
     region_name: Optional[str] = Field(None, min_length=1, max_length=100)
     district_name: Optional[str] = Field(None, min_length=1, max_length=100)
     district_type: Optional[str] = Field(None, max_length=50)
@@ -99,10 +105,12 @@ class HouseholdBase(BaseModel):
 
 class HouseholdCreate(HouseholdBase):
     """Model for creating household"""
-    pass
+    model_config = WRITE_MODEL_CONFIG
 
 class HouseholdUpdate(BaseModel):
     """Model for updating household"""
+    model_config = WRITE_MODEL_CONFIG
+
     type_of_residence: Optional[str] = Field(None, max_length=50)
     interview_date_completed: Optional[date] = None
     total_visits: Optional[int] = Field(None, ge=1)
@@ -111,6 +119,7 @@ class HouseholdUpdate(BaseModel):
 class HouseholdResponse(HouseholdBase, BaseModelWithId):
     """Model for household response"""
     household_id: int
+    housing_unit_status: Optional[str] = HousingUnitStatus.OCCUPIED.value
     total_members: Optional[int] = 0
     total_males: Optional[int] = 0
     total_females: Optional[int] = 0
@@ -148,22 +157,25 @@ class IndividualBase(BaseModel):
     months_absent: Optional[int] = Field(None, ge=0, le=12)
     absence_destination: Optional[str] = Field(None, max_length=200)
 
-    @validator('age', 'date_of_birth')
-    def validate_age_consistency(cls, v, values):
+    @field_validator('age')
+    @classmethod
+    def validate_age_consistency(cls, v: Optional[int], info: ValidationInfo) -> Optional[int]:
         """Validate age consistency with date of birth"""
-        if 'date_of_birth' in values and values['date_of_birth'] and v:
-            from datetime import date
-            calculated_age = (date.today() - values['date_of_birth']).days // 365
+        date_of_birth = info.data.get('date_of_birth')
+        if date_of_birth and v:
+            calculated_age = (date.today() - date_of_birth).days // 365
             if abs(calculated_age - v) > 1:  # Allow 1 year difference
                 raise ValueError('Age does not match date of birth')
         return v
 
 class IndividualCreate(IndividualBase):
     """Model for creating individual"""
-    pass
+    model_config = WRITE_MODEL_CONFIG
 
 class IndividualUpdate(BaseModel):
     """Model for updating individual"""
+    model_config = WRITE_MODEL_CONFIG
+
     full_name: Optional[str] = Field(None, min_length=1, max_length=200)
     relationship_to_head: Optional[str] = Field(None, max_length=50)
     sex: Optional[Sex] = None
@@ -177,6 +189,12 @@ class IndividualUpdate(BaseModel):
 class IndividualResponse(IndividualBase, BaseModelWithId):
     """Model for individual response"""
     individual_id: int
+    # Enum columns come back from Oracle as plain strings
+    sex: Optional[str] = None
+    born_in_current_location: Optional[str] = None
+    lived_here_since_birth: Optional[str] = None
+    ever_attended_school: Optional[str] = None
+    status_on_census_night: Optional[str] = CensusNightStatus.PRESENT.value
 
 # =========================================
 # HOUSING MODELS
@@ -211,10 +229,12 @@ class HousingBase(BaseModel):
 
 class HousingCreate(HousingBase):
     """Model for creating housing"""
-    pass
+    model_config = WRITE_MODEL_CONFIG
 
 class HousingUpdate(BaseModel):
     """Model for updating housing"""
+    model_config = WRITE_MODEL_CONFIG
+
     dwelling_type: Optional[str] = Field(None, max_length=100)
     outer_wall_material: Optional[str] = Field(None, max_length=100)
     floor_material: Optional[str] = Field(None, max_length=100)
@@ -227,6 +247,10 @@ class HousingUpdate(BaseModel):
 class HousingResponse(HousingBase, BaseModelWithId):
     """Model for housing response"""
     housing_id: int
+    rooms_shared_with_others: Optional[str] = None
+    toilet_shared: Optional[str] = None
+    has_fixed_telephone: Optional[str] = None
+    has_computer: Optional[str] = None
 
 # =========================================
 # ECONOMIC ACTIVITY MODELS
@@ -253,10 +277,12 @@ class EconomicActivityBase(BaseModel):
 
 class EconomicActivityCreate(EconomicActivityBase):
     """Model for creating economic activity"""
-    pass
+    model_config = WRITE_MODEL_CONFIG
 
 class EconomicActivityUpdate(BaseModel):
     """Model for updating economic activity"""
+    model_config = WRITE_MODEL_CONFIG
+
     engaged_in_economic_activity: Optional[YesNo] = None
     occupation_description: Optional[str] = Field(None, max_length=500)
     workplace_name: Optional[str] = Field(None, max_length=200)
@@ -268,6 +294,9 @@ class EconomicActivityUpdate(BaseModel):
 class EconomicActivityResponse(EconomicActivityBase, BaseModelWithId):
     """Model for economic activity response"""
     economic_id: int
+    engaged_in_economic_activity: Optional[str] = YesNo.NO.value
+    owns_mobile_phone: Optional[str] = YesNo.NO.value
+    uses_internet: Optional[str] = YesNo.NO.value
 
 # =========================================
 # FERTILITY MODELS
@@ -285,10 +314,12 @@ class FertilityBase(BaseModel):
 
 class FertilityCreate(FertilityBase):
     """Model for creating fertility record"""
-    pass
+    model_config = WRITE_MODEL_CONFIG
 
 class FertilityUpdate(BaseModel):
     """Model for updating fertility record"""
+    model_config = WRITE_MODEL_CONFIG
+
     children_born_boys: Optional[int] = Field(None, ge=0)
     children_born_girls: Optional[int] = Field(None, ge=0)
     children_surviving_boys: Optional[int] = Field(None, ge=0)
@@ -304,6 +335,8 @@ class FertilityResponse(FertilityBase, BaseModelWithId):
 
 class HouseholdDemographicsResponse(BaseModel):
     """Response model for household demographics"""
+    model_config = ConfigDict(frozen=True, populate_by_name=True)
+
     individual_id: int
     full_name: str
     sex: Optional[str]
@@ -320,6 +353,8 @@ class HouseholdDemographicsResponse(BaseModel):
 
 class RegionalStatisticsResponse(BaseModel):
     """Response model for regional statistics"""
+    model_config = ConfigDict(frozen=True, populate_by_name=True)
+
     region_name: str
     district_name: str
     total_households: int
@@ -332,6 +367,8 @@ class RegionalStatisticsResponse(BaseModel):
 
 class HousingConditionsResponse(BaseModel):
     """Response model for housing conditions"""
+    model_config = ConfigDict(frozen=True, populate_by_name=True)
+
     region_name: str
     district_name: str
     dwelling_type: Optional[str]
@@ -353,16 +390,20 @@ class APIResponse(BaseModel):
     count: Optional[int] = None
 
 class PaginationParams(BaseModel):
-    """Pagination parameters"""
+    """Pagination parameters (keyset when after_id is set, otherwise page-based)"""
     page: int = Field(1, ge=1)
     size: int = Field(20, ge=1, le=100)
+    after_id: Optional[int] = Field(None, ge=0)  # Last individual_id of the previous page
 
-    @property
+    @computed_field
+    @cached_property
     def offset(self) -> int:
         return (self.page - 1) * self.size
 
 class SearchFilters(BaseModel):
     """Search filters for census data"""
+    model_config = ConfigDict(use_enum_values=True)
+
     region_name: Optional[str] = None
     district_name: Optional[str] = None
     sex: Optional[Sex] = None
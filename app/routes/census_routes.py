@@ -4,103 +4,195 @@
 # Created: 2025-07-23 10:33:15
 # =========================================
 
-from fastapi import APIRouter, HTTPException, Depends, Query
-from typing import Optional, List
+from fastapi import APIRouter, HTTPException, Depends, Path, Query, Request, Response
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import StreamingResponse
+from starlette.background import BackgroundTask
+from app.utils.orjson_response import ORJSONResponse, dumps
+from typing import Annotated, Optional, List, Dict
+from cachetools import TTLCache
+import asyncio
+import anyio
+import orjson
 from app.models.pydantic_models import *
-from app.utils.db_service import census_service
+from app.utils.db_service import census_service, async_census_service
+from app.utils import cache
+from config.oracle_config import settings
 import logging
 
 logger = logging.getLogger(__name__)
 
 # Create API router
-router = APIRouter()
+router = APIRouter(default_response_class=ORJSONResponse)
+
+def _envelope(message: str, data: Optional[dict] = None, count: Optional[int] = None,
+              success: bool = True) -> dict:
+    """Build the APIResponse envelope as a plain dict"""
+    return {"success": success, "message": message, "data": data, "count": count}
+
+def _ok(message: str, data: Optional[dict] = None, count: Optional[int] = None,
+        success: bool = True, headers: Optional[dict] = None) -> ORJSONResponse:
+    """Build the APIResponse envelope as a ready response (skips jsonable_encoder)"""
+    return ORJSONResponse(_envelope(message, data, count, success), headers=headers)
+
+def _list_prefix(message: str, key: str) -> bytes:
+    """Serialize the fixed head of a list envelope once, up to the data payload"""
+    return b'{"success":true,"message":' + orjson.dumps(message) + b',"data":{' + orjson.dumps(key) + b':'
+
+def _ok_list(prefix: bytes, rows: list, headers: Optional[dict] = None) -> Response:
+    """Complete a precomputed list envelope; only the rows are serialized per request"""
+    return Response(
+        content=prefix + dumps(rows) + b'},"count":%d}' % len(rows),
+        media_type="application/json",
+        headers=headers
+    )
+
+_OK_GEOGRAPHICAL_INFO = _list_prefix("Geographical information retrieved successfully", "geographical_info")
+_OK_HOUSEHOLDS = _list_prefix("Households retrieved successfully", "households")
+_OK_INDIVIDUALS = _list_prefix("Individuals retrieved successfully", "individuals")
+
+async def _cached_response(key: str, loader, headers: Optional[dict] = None) -> Response:
+    """Serve a cached analytics envelope, building it with loader on a miss"""
+    body = await cache.cached(key, loader)
+    return Response(content=body, media_type="application/json", headers=headers)
+
+async def _etag(*tables: str) -> str:
+    """Weak ETag from the committed data version of tables (every table when none given)"""
+    version = await async_census_service.get_data_version(tables)
+    return f'W/"{"+".join(tables).lower() or "all"}-{version}"'
+
+async def _mview_etag(mview_name: str) -> str:
+    """Weak ETag for data served from a materialized view: changes on each refresh"""
+    last_refresh = await run_in_threadpool(census_service.get_mview_last_refresh, mview_name)
+    return f'W/"{mview_name.lower()}-{last_refresh}"'
+
+def _not_modified(request: Request, etag: str) -> bool:
+    """True when the client already holds the representation tagged etag"""
+    if_none_match = request.headers.get("if-none-match")
+    return bool(if_none_match) and etag in [tag.strip() for tag in if_none_match.split(",")]
+
+# In-process memo for endpoints polled by load balancers and dashboards
+_health_cache = TTLCache(maxsize=1, ttl=settings.ORACLE_HEALTH_CHECK_TTL)
+_health_lock = asyncio.Lock()
+_stats_cache = TTLCache(maxsize=1, ttl=60)
+_stats_lock = asyncio.Lock()
+
+async def _memoized(store: TTLCache, lock: asyncio.Lock, loader, key: str = "value"):
+    """Return the memoized value, letting one coroutine refresh it while others wait"""
+    value = store.get(key)
+    if value is not None:
+        return value
+    async with lock:
+        value = store.get(key)
+        if value is None:
+            value = await loader()
+            store[key] = value
+        return value
+
+# Highest id known per table. Creates in this process raise it directly; an id
+# above it is re-checked against MAX(id) (an index min/max scan) before a 404,
+# since other workers, the CLI and Streamlit create records too
+ID_UPPER_BOUND: Dict[str, int] = {
+    "GEOGRAPHICAL_INFO": 0, "HOUSEHOLD": 0, "INDIVIDUAL": 0, "HOUSING": 0
+}
+
+def _note_id(table: str, *record_ids: int) -> None:
+    """Raise the known upper bound after a create"""
+    ID_UPPER_BOUND[table] = max([ID_UPPER_BOUND[table], *(int(i) for i in record_ids if i)])
+
+async def _require_known_id(table: str, record_id: int, detail: str) -> None:
+    """404 without touching the record when record_id is above every id issued so far"""
+    if record_id <= ID_UPPER_BOUND[table]:
+        return
+    _note_id(table, await run_in_threadpool(census_service.get_max_id, table))
+    if record_id > ID_UPPER_BOUND[table]:
+        raise HTTPException(status_code=404, detail=detail)
 
 # =========================================
 # GEOGRAPHICAL INFORMATION ROUTES
 # =========================================
 
-@router.post("/geographical-info/", response_model=APIResponse)
+@router.post("/geographical-info/", responses={200: {"model": APIResponse}})
 async def create_geographical_info(geo_data: GeographicalInfoCreate):
     """Create new geographical information"""
-    try:
-        geo_id = census_service.create_geographical_info(geo_data)
-        return APIResponse(
-            success=True,
-            message="Geographical information created successfully",
-            data={"geo_id": geo_id}
-        )
-    except Exception as e:
-        logger.error(f"Error creating geographical info: {e}")
-        raise HTTPException(status_code=500, detail=str(e))
+    geo_id = await run_in_threadpool(census_service.create_geographical_info, geo_data)
+    _note_id("GEOGRAPHICAL_INFO", geo_id)
+    await cache.invalidate()
+    return _ok(
+        "Geographical information created successfully",
+        data={"geo_id": geo_id}
+    )
+
+@router.post("/geographical-info/bulk", responses={200: {"model": APIResponse}})
+async def create_geographical_info_bulk(geo_records: List[GeographicalInfoCreate]):
+    """Create many geographical records in one batched database call"""
+    geo_ids = await run_in_threadpool(census_service.create_geographical_info_bulk, geo_records)
+    _note_id("GEOGRAPHICAL_INFO", *geo_ids)
+    await cache.invalidate()
+    return _ok(
+        "Geographical information created successfully",
+        data={"geo_ids": geo_ids},
+        count=len(geo_ids)
+    )
 
 @router.get("/geographical-info/", response_model=APIResponse)
-async def get_geographical_info(geo_id: Optional[int] = Query(None)):
+async def get_geographical_info(request: Request, geo_id: Optional[int] = Query(None)):
     """Get geographical information"""
-    try:
-        data = census_service.get_geographical_info(geo_id)
-        return APIResponse(
-            success=True,
-            message="Geographical information retrieved successfully",
-            data={"geographical_info": data},
-            count=len(data)
-        )
-    except Exception as e:
-        logger.error(f"Error retrieving geographical info: {e}")
-        raise HTTPException(status_code=500, detail=str(e))
+    etag = await _etag("GEOGRAPHICAL_INFO")
+    if _not_modified(request, etag):
+        return Response(status_code=304, headers={"ETag": etag})
 
-@router.put("/geographical-info/{geo_id}", response_model=APIResponse)
-async def update_geographical_info(geo_id: int, geo_data: GeographicalInfoUpdate):
-    """Update geographical information"""
-    try:
-        success = census_service.update_geographical_info(geo_id, geo_data)
-        if success:
-            return APIResponse(
-                success=True,
-                message="Geographical information updated successfully"
-            )
-        else:
-            raise HTTPException(status_code=404, detail="Geographical information not found")
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"Error updating geographical info: {e}")
-        raise HTTPException(status_code=500, detail=str(e))
+    data = await async_census_service.get_geographical_info(geo_id)
+    return _ok_list(_OK_GEOGRAPHICAL_INFO, data, headers={"ETag": etag})
 
-@router.delete("/geographical-info/{geo_id}", response_model=APIResponse)
-async def delete_geographical_info(geo_id: int):
+@router.put("/geographical-info/{geo_id}", responses={200: {"model": APIResponse}})
+async def update_geographical_info(geo_id: Annotated[int, Path(gt=0)], geo_data: GeographicalInfoUpdate):
+    """Update geographical information"""
+    await _require_known_id("GEOGRAPHICAL_INFO", geo_id, "Geographical information not found")
+    success = await run_in_threadpool(census_service.update_geographical_info, geo_id, geo_data)
+    if success:
+        await cache.invalidate()
+        return _ok("Geographical information updated successfully")
+    else:
+        raise HTTPException(status_code=404, detail="Geographical information not found")
+
+@router.delete("/geographical-info/{geo_id}", responses={200: {"model": APIResponse}})
+async def delete_geographical_info(geo_id: Annotated[int, Path(gt=0)]):
     """Delete geographical information"""
-    try:
-        success = census_service.delete_geographical_info(geo_id)
-        if success:
-            return APIResponse(
-                success=True,
-                message="Geographical information deleted successfully"
-            )
-        else:
-            raise HTTPException(status_code=404, detail="Geographical information not found")
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"Error deleting geographical info: {e}")
-        raise HTTPException(status_code=500, detail=str(e))
+    await _require_known_id("GEOGRAPHICAL_INFO", geo_id, "Geographical information not found")
+    success = await run_in_threadpool(census_service.delete_geographical_info, geo_id)
+    if success:
+        await cache.invalidate()
+        return _ok("Geographical information deleted successfully")
+    else:
+        raise HTTPException(status_code=404, detail="Geographical information not found")
 
 # =========================================
 # HOUSEHOLD ROUTES
 # =========================================
 
-@router.post("/households/", response_model=APIResponse)
+@router.post("/households/", responses={200: {"model": APIResponse}})
 async def create_household(household_data: HouseholdCreate):
     """Create new household"""
-    try:
-        household_id = census_service.create_household(household_data)
-        return APIResponse(
-            success=True,
-            message="Household created successfully",
-            data={"household_id": household_id}
-        )
-    except Exception as e:
-        logger.error(f"Error creating household: {e}")
-        raise HTTPException(status_code=500, detail=str(e))
+    household_id = await run_in_threadpool(census_service.create_household, household_data)
+    _note_id("HOUSEHOLD", household_id)
+    await cache.invalidate()
+    return _ok(
+        "Household created successfully",
+        data={"household_id": household_id}
+    )
+
+@router.post("/households/bulk", responses={200: {"model": APIResponse}})
+async def create_households_bulk(households: List[HouseholdCreate]):
+    """Create many households in one batched database call"""
+    household_ids = await run_in_threadpool(census_service.create_households_bulk, households)
+    _note_id("HOUSEHOLD", *household_ids)
+    await cache.invalidate()
+    return _ok(
+        "Households created successfully",
+        data={"household_ids": household_ids},
+        count=len(household_ids)
+    )
 
 @router.get("/households/", response_model=APIResponse)
 async def get_households(
@@ -108,71 +200,57 @@ async def get_households(
     geo_id: Optional[int] = Query(None)
 ):
     """Get households"""
-    try:
-        data = census_service.get_households(household_id, geo_id)
-        return APIResponse(
-            success=True,
-            message="Households retrieved successfully",
-            data={"households": data},
-            count=len(data)
-        )
-    except Exception as e:
-        logger.error(f"Error retrieving households: {e}")
-        raise HTTPException(status_code=500, detail=str(e))
+    data = await async_census_service.get_households(household_id, geo_id)
+    return _ok_list(_OK_HOUSEHOLDS, data)
 
-@router.put("/households/{household_id}", response_model=APIResponse)
-async def update_household(household_id: int, household_data: HouseholdUpdate):
+@router.put("/households/{household_id}", responses={200: {"model": APIResponse}})
+async def update_household(household_id: Annotated[int, Path(gt=0)], household_data: HouseholdUpdate):
     """Update household"""
-    try:
-        success = census_service.update_household(household_id, household_data)
-        if success:
-            return APIResponse(
-                success=True,
-                message="Household updated successfully"
-            )
-        else:
-            raise HTTPException(status_code=404, detail="Household not found")
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"Error updating household: {e}")
-        raise HTTPException(status_code=500, detail=str(e))
-
-@router.delete("/households/{household_id}", response_model=APIResponse)
-async def delete_household(household_id: int):
+    await _require_known_id("HOUSEHOLD", household_id, "Household not found")
+    success = await run_in_threadpool(census_service.update_household, household_id, household_data)
+    if success:
+        await cache.invalidate()
+        return _ok("Household updated successfully")
+    else:
+        raise HTTPException(status_code=404, detail="Household not found")
+
+@router.delete("/households/{household_id}", responses={200: {"model": APIResponse}})
+async def delete_household(household_id: Annotated[int, Path(gt=0)]):
     """Delete household"""
-    try:
-        success = census_service.delete_household(household_id)
-        if success:
-            return APIResponse(
-                success=True,
-                message="Household deleted successfully"
-            )
-        else:
-            raise HTTPException(status_code=404, detail="Household not found")
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"Error deleting household: {e}")
-        raise HTTPException(status_code=500, detail=str(e))
+    await _require_known_id("HOUSEHOLD", household_id, "Household not found")
+    success = await run_in_threadpool(census_service.delete_household, household_id)
+    if success:
+        await cache.invalidate()
+        return _ok("Household deleted successfully")
+    else:
+        raise HTTPException(status_code=404, detail="Household not found")
 
 # =========================================
 # INDIVIDUAL ROUTES
 # =========================================
 
-@router.post("/individuals/", response_model=APIResponse)
+@router.post("/individuals/", responses={200: {"model": APIResponse}})
 async def create_individual(individual_data: IndividualCreate):
     """Create new individual"""
-    try:
-        individual_id = census_service.create_individual(individual_data)
-        return APIResponse(
-            success=True,
-            message="Individual created successfully",
-            data={"individual_id": individual_id}
-        )
-    except Exception as e:
-        logger.error(f"Error creating individual: {e}")
-        raise HTTPException(status_code=500, detail=str(e))
+    individual = await run_in_threadpool(census_service.create_individual_returning, individual_data)
+    _note_id("INDIVIDUAL", individual.get("individual_id"))
+    await cache.invalidate()
+    return _ok(
+        "Individual created successfully",
+        data={"individual_id": individual.get("individual_id"), "individual": individual}
+    )
+
+@router.post("/individuals/bulk", responses={200: {"model": APIResponse}})
+async def create_individuals_bulk(individuals: List[IndividualCreate]):
+    """Create many individuals in one batched database call"""
+    individual_ids = await run_in_threadpool(census_service.create_individuals_bulk, individuals)
+    _note_id("INDIVIDUAL", *individual_ids)
+    await cache.invalidate()
+    return _ok(
+        "Individuals created successfully",
+        data={"individual_ids": individual_ids},
+        count=len(individual_ids)
+    )
 
 @router.get("/individuals/", response_model=APIResponse)
 async def get_individuals(
@@ -180,221 +258,218 @@ async def get_individuals(
     household_id: Optional[int] = Query(None)
 ):
     """Get individuals"""
-    try:
-        data = census_service.get_individuals(individual_id, household_id)
-        return APIResponse(
-            success=True,
-            message="Individuals retrieved successfully",
-            data={"individuals": data},
-            count=len(data)
-        )
-    except Exception as e:
-        logger.error(f"Error retrieving individuals: {e}")
-        raise HTTPException(status_code=500, detail=str(e))
+    data = await async_census_service.get_individuals(individual_id, household_id)
+    return _ok_list(_OK_INDIVIDUALS, data)
 
-@router.put("/individuals/{individual_id}", response_model=APIResponse)
-async def update_individual(individual_id: int, individual_data: IndividualUpdate):
+@router.put("/individuals/{individual_id}", responses={200: {"model": APIResponse}})
+async def update_individual(individual_id: Annotated[int, Path(gt=0)], individual_data: IndividualUpdate):
     """Update individual"""
-    try:
-        success = census_service.update_individual(individual_id, individual_data)
-        if success:
-            return APIResponse(
-                success=True,
-                message="Individual updated successfully"
-            )
-        else:
-            raise HTTPException(status_code=404, detail="Individual not found")
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"Error updating individual: {e}")
-        raise HTTPException(status_code=500, detail=str(e))
-
-@router.delete("/individuals/{individual_id}", response_model=APIResponse)
-async def delete_individual(individual_id: int):
+    await _require_known_id("INDIVIDUAL", individual_id, "Individual not found")
+    success = await run_in_threadpool(census_service.update_individual, individual_id, individual_data)
+    if success:
+        await cache.invalidate()
+        return _ok("Individual updated successfully")
+    else:
+        raise HTTPException(status_code=404, detail="Individual not found")
+
+@router.delete("/individuals/{individual_id}", responses={200: {"model": APIResponse}})
+async def delete_individual(individual_id: Annotated[int, Path(gt=0)]):
     """Delete individual"""
-    try:
-        success = census_service.delete_individual(individual_id)
-        if success:
-            return APIResponse(
-                success=True,
-                message="Individual deleted successfully"
-            )
-        else:
-            raise HTTPException(status_code=404, detail="Individual not found")
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"Error deleting individual: {e}")
-        raise HTTPException(status_code=500, detail=str(e))
+    await _require_known_id("INDIVIDUAL", individual_id, "Individual not found")
+    success = await run_in_threadpool(census_service.delete_individual, individual_id)
+    if success:
+        await cache.invalidate()
+        return _ok("Individual deleted successfully")
+    else:
+        raise HTTPException(status_code=404, detail="Individual not found")
 
 # =========================================
 # HOUSING ROUTES
 # =========================================
 
-@router.post("/housing/", response_model=APIResponse)
+@router.post("/housing/", responses={200: {"model": APIResponse}})
 async def create_housing(housing_data: HousingCreate):
     """Create new housing information"""
-    try:
-        housing_id = census_service.create_housing(housing_data)
-        return APIResponse(
-            success=True,
-            message="Housing information created successfully",
-            data={"housing_id": housing_id}
-        )
-    except Exception as e:
-        logger.error(f"Error creating housing: {e}")
-        raise HTTPException(status_code=500, detail=str(e))
-
-@router.put("/housing/{housing_id}", response_model=APIResponse)
-async def update_housing(housing_id: int, housing_data: HousingUpdate):
+    housing_id = await run_in_threadpool(census_service.create_housing, housing_data)
+    _note_id("HOUSING", housing_id)
+    await cache.invalidate()
+    return _ok(
+        "Housing information created successfully",
+        data={"housing_id": housing_id}
+    )
+
+@router.post("/housing/bulk", responses={200: {"model": APIResponse}})
+async def create_housing_bulk(housing_records: List[HousingCreate]):
+    """Create many housing records in one batched database call"""
+    housing_ids = await run_in_threadpool(census_service.create_housing_bulk, housing_records)
+    _note_id("HOUSING", *housing_ids)
+    await cache.invalidate()
+    return _ok(
+        "Housing information created successfully",
+        data={"housing_ids": housing_ids},
+        count=len(housing_ids)
+    )
+
+@router.put("/housing/{housing_id}", responses={200: {"model": APIResponse}})
+async def update_housing(housing_id: Annotated[int, Path(gt=0)], housing_data: HousingUpdate):
     """Update housing information"""
-    try:
-        success = census_service.update_housing(housing_id, housing_data)
-        if success:
-            return APIResponse(
-                success=True,
-                message="Housing information updated successfully"
-            )
-        else:
-            raise HTTPException(status_code=404, detail="Housing information not found")
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"Error updating housing: {e}")
-        raise HTTPException(status_code=500, detail=str(e))
-
-@router.delete("/housing/{housing_id}", response_model=APIResponse)
-async def delete_housing(housing_id: int):
+    await _require_known_id("HOUSING", housing_id, "Housing information not found")
+    success = await run_in_threadpool(census_service.update_housing, housing_id, housing_data)
+    if success:
+        await cache.invalidate()
+        return _ok("Housing information updated successfully")
+    else:
+        raise HTTPException(status_code=404, detail="Housing information not found")
+
+@router.delete("/housing/{housing_id}", responses={200: {"model": APIResponse}})
+async def delete_housing(housing_id: Annotated[int, Path(gt=0)]):
     """Delete housing information"""
-    try:
-        success = census_service.delete_housing(housing_id)
-        if success:
-            return APIResponse(
-                success=True,
-                message="Housing information deleted successfully"
-            )
-        else:
-            raise HTTPException(status_code=404, detail="Housing information not found")
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"Error deleting housing: {e}")
-        raise HTTPException(status_code=500, detail=str(e))
+    await _require_known_id("HOUSING", housing_id, "Housing information not found")
+    success = await run_in_threadpool(census_service.delete_housing, housing_id)
+    if success:
+        await cache.invalidate()
+        return _ok("Housing information deleted successfully")
+    else:
+        raise HTTPException(status_code=404, detail="Housing information not found")
 
 # =========================================
 # ECONOMIC ACTIVITY ROUTES
 # =========================================
 
-@router.post("/economic-activity/", response_model=APIResponse)
+@router.post("/economic-activity/", responses={200: {"model": APIResponse}})
 async def create_economic_activity(economic_data: EconomicActivityCreate):
     """Create new economic activity"""
-    try:
-        economic_id = census_service.create_economic_activity(economic_data)
-        return APIResponse(
-            success=True,
-            message="Economic activity created successfully",
-            data={"economic_id": economic_id}
-        )
-    except Exception as e:
-        logger.error(f"Error creating economic activity: {e}")
-        raise HTTPException(status_code=500, detail=str(e))
+    economic_id = await run_in_threadpool(census_service.create_economic_activity, economic_data)
+    await cache.invalidate()
+    return _ok(
+        "Economic activity created successfully",
+        data={"economic_id": economic_id}
+    )
+
+@router.post("/economic-activity/bulk", responses={200: {"model": APIResponse}})
+async def create_economic_activities_bulk(economic_records: List[EconomicActivityCreate]):
+    """Create many economic activity records in one batched database call"""
+    economic_ids = await run_in_threadpool(census_service.create_economic_activities_bulk, economic_records)
+    await cache.invalidate()
+    return _ok(
+        "Economic activities created successfully",
+        data={"economic_ids": economic_ids},
+        count=len(economic_ids)
+    )
 
 # =========================================
 # ANALYTICS & REPORTING ROUTES
 # =========================================
 
 @router.get("/analytics/household-demographics/{household_id}", response_model=APIResponse)
-async def get_household_demographics(household_id: int):
+async def get_household_demographics(household_id: Annotated[int, Path(gt=0)]):
     """Get household demographics using stored procedure with cursor"""
-    try:
-        data = census_service.get_household_demographics(household_id)
-        return APIResponse(
-            success=True,
-            message="Household demographics retrieved successfully",
+    async def load():
+        data = await run_in_threadpool(census_service.get_household_demographics, household_id)
+        return _envelope(
+            "Household demographics retrieved successfully",
             data={"demographics": data},
             count=len(data)
         )
-    except Exception as e:
-        logger.error(f"Error retrieving household demographics: {e}")
-        raise HTTPException(status_code=500, detail=str(e))
+    return await _cached_response(f"analytics:demographics:{household_id}", load)
 
 @router.get("/analytics/regional-statistics", response_model=APIResponse)
 async def get_regional_statistics(region_name: Optional[str] = Query(None)):
     """Get regional statistics using stored procedure with cursor"""
-    try:
-        data = census_service.get_regional_statistics(region_name)
-        return APIResponse(
-            success=True,
-            message="Regional statistics retrieved successfully",
+    async def load():
+        data = await async_census_service.get_regional_statistics(region_name)
+        return _envelope(
+            "Regional statistics retrieved successfully",
             data={"statistics": data},
             count=len(data)
         )
-    except Exception as e:
-        logger.error(f"Error retrieving regional statistics: {e}")
-        raise HTTPException(status_code=500, detail=str(e))
+    return await _cached_response(f"analytics:regional:{region_name}", load)
 
 @router.get("/analytics/housing-conditions", response_model=APIResponse)
-async def get_housing_conditions(district_name: Optional[str] = Query(None)):
+async def get_housing_conditions(request: Request, district_name: Optional[str] = Query(None)):
     """Get housing conditions using stored procedure with cursor"""
-    try:
-        data = census_service.get_housing_conditions(district_name)
-        return APIResponse(
-            success=True,
-            message="Housing conditions retrieved successfully",
+    etag = await _mview_etag("MV_HOUSING_CONDITIONS")
+    if _not_modified(request, etag):
+        return Response(status_code=304, headers={"ETag": etag})
+
+    async def load():
+        # Keyed on the MV refresh ETag, so bypass the service's memo and disk caches
+        data = await run_in_threadpool(census_service.load_housing_conditions, district_name)
+        return _envelope(
+            "Housing conditions retrieved successfully",
             data={"conditions": data},
             count=len(data)
         )
-    except Exception as e:
-        logger.error(f"Error retrieving housing conditions: {e}")
-        raise HTTPException(status_code=500, detail=str(e))
+    return await _cached_response(f"analytics:housing:{district_name}:{etag}", load, {"ETag": etag})
 
 @router.get("/analytics/database-statistics", response_model=APIResponse)
-async def get_database_statistics():
+async def get_database_statistics(request: Request, exact: bool = Query(False)):
     """Get general database statistics"""
-    try:
-        data = census_service.get_database_statistics()
-        return APIResponse(
-            success=True,
-            message="Database statistics retrieved successfully",
+    etag = await _etag()
+    if not exact:
+        # Estimates change only when statistics are gathered, which writes no data
+        last_analyzed = await async_census_service.get_statistics_last_analyzed()
+        etag = etag.replace('W/"', f'W/"estimated-{last_analyzed}-', 1)
+    if _not_modified(request, etag):
+        return Response(status_code=304, headers={"ETag": etag})
+
+    async def load():
+        data = await run_in_threadpool(census_service.get_database_statistics.__wrapped__, exact)
+        return _envelope(
+            "Database statistics retrieved successfully",
             data={"statistics": data}
         )
-    except Exception as e:
-        logger.error(f"Error retrieving database statistics: {e}")
-        raise HTTPException(status_code=500, detail=str(e))
+    body = await _memoized(
+        _stats_cache, _stats_lock,
+        lambda: cache.cached(f"analytics:database-statistics:{etag}", load),
+        key=etag
+    )
+    return Response(content=body, media_type="application/json", headers={"ETag": etag})
 
 # =========================================
 # SEARCH & FILTER ROUTES
 # =========================================
 
-@router.post("/search/individuals", response_model=APIResponse)
+@router.post("/search/individuals", responses={200: {"model": APIResponse}})
 async def search_individuals(
     filters: SearchFilters,
     page: int = Query(1, ge=1),
-    size: int = Query(20, ge=1, le=100)
+    size: int = Query(20, ge=1, le=100),
+    cursor: Optional[int] = Query(None, ge=0, description="next_cursor from the previous page"),
+    include_total: bool = Query(False)
 ):
     """Search individuals with filters and pagination"""
-    try:
-        pagination = PaginationParams(page=page, size=size)
-        data, total_count = census_service.search_individuals(filters, pagination)
-
-        return APIResponse(
-            success=True,
-            message="Individual search completed successfully",
-            data={
-                "individuals": data,
-                "pagination": {
-                    "page": page,
-                    "size": size,
-                    "total": total_count,
-                    "pages": (total_count + size - 1) // size
-                }
-            },
-            count=len(data)
-        )
-    except Exception as e:
-        logger.error(f"Error searching individuals: {e}")
-        raise HTTPException(status_code=500, detail=str(e))
+    pagination = PaginationParams(page=page, size=size, after_id=cursor)
+    # One extra row is fetched to tell whether a next page exists
+    page_query = async_census_service.search_individuals_page(filters, pagination)
+
+    total_count = None
+    if include_total:
+        # Totals change slowly; serve them from the cache for a minute,
+        # fetching a missing one alongside the page rather than after it
+        (data, has_next), body = await asyncio.gather(page_query, cache.cached(
+            f"analytics:search-count:{filters.model_dump_json()}",
+            lambda: async_census_service.count_individuals(filters),
+            ttl=60
+        ))
+        total_count = orjson.loads(body)
+    else:
+        data, has_next = await page_query
+
+    return _ok(
+        "Individual search completed successfully",
+        data={
+            "individuals": data,
+            "pagination": {
+                "page": page,
+                "size": size,
+                "next_cursor": data[-1]["individual_id"] if has_next else None,
+                "total": total_count,
+                "pages": (total_count + size - 1) // size if total_count is not None else None
+            }
+        },
+        count=len(data)
+    )
 
 # =========================================
 # ACTIVITY LOG ROUTES
@@ -407,18 +482,34 @@ async def get_activity_log(
     user_name: Optional[str] = Query(None),
     days_back: int = Query(7, ge=1, le=30)
 ):
-    """Get activity log using stored procedure with cursor"""
-    try:
-        data = census_service.get_activity_log(table_name, operation_type, user_name, days_back)
-        return APIResponse(
-            success=True,
-            message="Activity log retrieved successfully",
-            data={"activity_log": data},
-            count=len(data)
-        )
-    except Exception as e:
-        logger.error(f"Error retrieving activity log: {e}")
-        raise HTTPException(status_code=500, detail=str(e))
+    """Get activity log using stored procedure with cursor, streamed in batches"""
+    batches = census_service.iter_activity_log(table_name, operation_type, user_name, days_back)
+    # Fetch the first batch up front so procedure errors still produce a 500
+    first = await run_in_threadpool(next, batches, None)
+
+    async def stream():
+        """Write the APIResponse envelope around the rows as they are fetched"""
+        count = 0
+        batch = first
+        try:
+            yield b'{"success":true,"message":"Activity log retrieved successfully","data":{"activity_log":['
+            while batch:
+                yield (b"," if count else b"") + b",".join(dumps(row) for row in batch)
+                count += len(batch)
+                batch = await run_in_threadpool(next, batches, None)
+            yield b']},"count":%d}' % count
+        except Exception:
+            logger.exception("Error streaming activity log")
+            raise
+        finally:
+            # Release the cursor and pooled connection off the event loop, even on disconnect
+            with anyio.CancelScope(shield=True):
+                await run_in_threadpool(batches.close)
+
+    # The background close (run in the threadpool) also covers a client that
+    # disconnects before the body is started; closing twice is harmless
+    return StreamingResponse(stream(), media_type="application/json",
+                             background=BackgroundTask(batches.close))
 
 # =========================================
 # HEALTH CHECK ROUTES
@@ -430,16 +521,19 @@ async def health_check():
     try:
         # Test database connection
         from app.database.oracle_connection import connection_manager
-        is_connected = connection_manager.test_connection()
 
-        return APIResponse(
-            success=is_connected,
-            message="Service is healthy" if is_connected else "Database connection failed",
-            data={"database_connected": is_connected}
-        )
+        async def probe():
+            # This memo is the only cache layer, so always run a real test
+            is_connected = await run_in_threadpool(connection_manager.test_connection, True)
+            return _envelope(
+                "Service is healthy" if is_connected else "Database connection failed",
+                data={"database_connected": is_connected},
+                success=is_connected
+            )
+        return ORJSONResponse(await _memoized(_health_cache, _health_lock, probe))
     except Exception as e:
-        logger.error(f"Health check failed: {e}")
-        return APIResponse(
-            success=False,
-            message=f"Health check failed: {str(e)}"
+        logger.error("Health check failed: %s", e)
+        return _ok(
+            f"Health check failed: {str(e)}",
+            success=False
         )
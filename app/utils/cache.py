@@ -0,0 +1,61 @@
+# =========================================
+# REDIS RESPONSE CACHE
+# Census Database Management System - Oracle Edition
+# =========================================
+
+from typing import Any, Awaitable, Callable, Optional
+import logging
+
+from config.oracle_config import settings
+from app.utils.orjson_response import dumps
+
+logger = logging.getLogger(__name__)
+
+_client = None
+
+def get_client():
+    """Create the Redis client on first use; None when REDIS_URL is not configured"""
+    global _client
+    if _client is None and settings.REDIS_URL:
+        import redis.asyncio as redis
+        _client = redis.Redis.from_url(settings.REDIS_URL)
+    return _client
+
+async def cached(key: str, loader: Callable[[], Awaitable[Any]], ttl: Optional[int] = None) -> bytes:
+    """Return serialized JSON for key, calling loader and storing the bytes on a miss"""
+    client = get_client()
+    if client is not None:
+        try:
+            body = await client.get(key)
+            if body is not None:
+                return body
+        except Exception as e:
+            logger.warning("Cache read failed for %s: %s", key, e)
+
+    body = dumps(await loader())
+
+    if client is not None:
+        try:
+            await client.setex(key, ttl or settings.ANALYTICS_CACHE_TTL, body)
+        except Exception as e:
+            logger.warning("Cache write failed for %s: %s", key, e)
+    return body
+
+async def invalidate(pattern: str = "analytics:*") -> None:
+    """Drop every cached entry matching pattern"""
+    client = get_client()
+    if client is None:
+        return
+    try:
+        keys = [key async for key in client.scan_iter(match=pattern, count=500)]
+        if keys:
+            await client.unlink(*keys)
+    except Exception as e:
+        logger.warning("Cache invalidation failed for %s: %s", pattern, e)
+
+async def close() -> None:
+    """Close the Redis client"""
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
@@ -4,14 +4,246 @@
 # Created: 2025-07-23 10:32:25
 # =========================================
 
+import functools
+from contextlib import contextmanager
+from operator import attrgetter
+import threading
 import oracledb
-from typing import Optional, List, Dict, Any, Tuple
-from app.database.oracle_connection import DirectOracleConnection, connection_manager
+from cachetools import TTLCache, cached
+from cachetools.keys import hashkey
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, List, Dict, Any, Callable, Tuple, Iterator
+from app.database.oracle_connection import DirectOracleConnection, AsyncOracleConnection, connection_manager, dict_rows, plsql_call_block
 from app.models.pydantic_models import *
+from app.utils import result_cache
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Runs secondary queries (e.g. search totals) alongside the caller's own query
+_query_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="census-query")
+
+# Memoized dashboard reads and search counts, dropped whenever this process writes;
+# slow-changing reads are also persisted across processes by result_cache
+_stats_cache = TTLCache(maxsize=128, ttl=60)
+_stats_lock = threading.Lock()
+
+def _clears_caches(func):
+    """Invalidate the memoized reads after a write service runs"""
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        try:
+            return func(*args, **kwargs)
+        finally:
+            with _stats_lock:
+                _stats_cache.clear()
+            result_cache.evict()
+    return wrapper
+
+@contextmanager
+def _write_connection():
+    """Yield a pooled connection, committed on exit"""
+    with connection_manager.acquire() as connection:
+        yield connection
+        connection.commit()
+
+# =========================================
+# BIND PARAMETER EXTRACTION
+# =========================================
+# Model fields are read with one attrgetter call per model; enum fields
+# already hold their plain values (use_enum_values on the write models)
+
+_HOUSEHOLD_FIELDS = attrgetter(
+    'geo_id', 'household_number_in_structure', 'type_of_residence',
+    'interview_date_started', 'interview_date_completed'
+)
+_INDIVIDUAL_FIELDS = attrgetter(
+    'household_id', 'person_line_number', 'full_name', 'relationship_to_head',
+    'sex', 'date_of_birth', 'age', 'nationality', 'ethnicity', 'religion',
+    'marital_status', 'highest_education_level'
+)
+_ECONOMIC_ACTIVITY_FIELDS = attrgetter(
+    'occupation_description', 'occupation_code', 'workplace_name',
+    'employment_status', 'employment_sector'
+)
+
+# =========================================
+# SQL STATEMENTS
+# =========================================
+# Built once so every call sends byte-identical text and hits the
+# session's statement cache instead of re-parsing
+
+SQL_GEOGRAPHICAL_INFO = """
+        SELECT geo_id, region_name, district_name, district_type, sub_district,
+               locality_name, detailed_address, contact_phone_1, contact_phone_2,
+               date_created, created_by
+        FROM GEOGRAPHICAL_INFO
+        """
+
+SQL_HOUSEHOLDS = """
+        SELECT h.household_id, h.geo_id, h.household_number_in_structure,
+               h.type_of_residence, h.total_members, h.total_males, h.total_females,
+               h.housing_unit_status, h.interview_date_started, h.interview_date_completed,
+               g.region_name, g.district_name, g.locality_name
+        FROM HOUSEHOLD h
+        JOIN GEOGRAPHICAL_INFO g ON h.geo_id = g.geo_id
+        WHERE 1=1
+        """
+
+# Repeated identical reads are answered from the server result cache until DML on a base table
+SQL_INDIVIDUAL_DETAILS = "SELECT /*+ RESULT_CACHE */ {columns} FROM V_INDIVIDUAL_DETAILS"
+
+# Columns a caller may project from the individuals listing instead of SELECT *
+INDIVIDUAL_COLUMNS = frozenset((
+    'individual_id', 'household_id', 'person_line_number', 'full_name', 'relationship_to_head',
+    'sex', 'date_of_birth', 'age', 'nationality', 'ethnicity', 'ethnicity_code',
+    'born_in_current_location', 'birthplace_region', 'birthplace_country',
+    'lived_here_since_birth', 'years_lived_here', 'religion', 'religion_code',
+    'marital_status', 'literacy_language', 'literacy_code', 'ever_attended_school',
+    'highest_education_level', 'highest_grade_completed', 'status_on_census_night',
+    'months_absent', 'absence_destination', 'date_created', 'date_modified',
+    'created_by', 'modified_by'
+))
+
+SQL_DATABASE_STATISTICS = """
+        SELECT 
+            (SELECT COUNT(*) FROM GEOGRAPHICAL_INFO) as total_geographical_areas,
+            (SELECT COUNT(*) FROM HOUSEHOLD) as total_households,
+            (SELECT COUNT(*) FROM INDIVIDUAL) as total_individuals,
+            (SELECT COUNT(*) FROM HOUSING) as total_housing_records,
+            (SELECT COUNT(*) FROM ECONOMIC_ACTIVITY) as total_economic_records,
+            (SELECT COUNT(*) FROM ACTIVITY_LOG) as total_log_entries
+        FROM DUAL
+        """
+
+# Optimizer row counts (refreshed by DBMS_STATS) keyed like SQL_DATABASE_STATISTICS
+SQL_TABLE_ROW_ESTIMATES = """
+        SELECT table_name, num_rows
+        FROM USER_TABLES
+        WHERE table_name IN ('GEOGRAPHICAL_INFO', 'HOUSEHOLD', 'INDIVIDUAL',
+                             'HOUSING', 'ECONOMIC_ACTIVITY', 'ACTIVITY_LOG')
+        """
+
+# Changes only when optimizer statistics are gathered (the estimates' version)
+SQL_STATISTICS_LAST_ANALYZED = """
+        SELECT MAX(last_analyzed) as last_analyzed
+        FROM USER_TABLES
+        WHERE table_name IN ('GEOGRAPHICAL_INFO', 'HOUSEHOLD', 'INDIVIDUAL',
+                             'HOUSING', 'ECONOMIC_ACTIVITY', 'ACTIVITY_LOG')
+        """
+
+STATISTICS_KEYS = {
+    'GEOGRAPHICAL_INFO': 'total_geographical_areas',
+    'HOUSEHOLD': 'total_households',
+    'INDIVIDUAL': 'total_individuals',
+    'HOUSING': 'total_housing_records',
+    'ECONOMIC_ACTIVITY': 'total_economic_records',
+    'ACTIVITY_LOG': 'total_log_entries',
+}
+
+# Insert through the procedure and open a cursor on the new row in one round-trip
+SQL_CREATE_INDIVIDUAL_RETURNING = """
+        BEGIN
+            SP_INSERT_INDIVIDUAL(%s, :individual_id);
+            OPEN :row_cursor FOR
+                SELECT * FROM INDIVIDUAL WHERE individual_id = :individual_id;
+        END;
+        """ % ", ".join(f":p{n}" for n in range(1, 14))
+
+# Stored procedure calls as fixed PL/SQL blocks, so each call reuses the
+# parsed statement from the session's statement cache
+SQL_CALL_INSERT_GEOGRAPHICAL_INFO = plsql_call_block('SP_INSERT_GEOGRAPHICAL_INFO', 14)
+SQL_CALL_UPDATE_GEOGRAPHICAL_INFO = plsql_call_block('SP_UPDATE_GEOGRAPHICAL_INFO', 9)
+SQL_CALL_DELETE_GEOGRAPHICAL_INFO = plsql_call_block('SP_DELETE_GEOGRAPHICAL_INFO', 1)
+SQL_CALL_INSERT_HOUSEHOLD = plsql_call_block('SP_INSERT_HOUSEHOLD', 9)
+SQL_CALL_UPDATE_HOUSEHOLD = plsql_call_block('SP_UPDATE_HOUSEHOLD', 5)
+SQL_CALL_DELETE_HOUSEHOLD = plsql_call_block('SP_DELETE_HOUSEHOLD', 1)
+SQL_CALL_INSERT_INDIVIDUAL = plsql_call_block('SP_INSERT_INDIVIDUAL', 14)
+SQL_CALL_UPDATE_INDIVIDUAL = plsql_call_block('SP_UPDATE_INDIVIDUAL', 10)
+SQL_CALL_DELETE_INDIVIDUAL = plsql_call_block('SP_DELETE_INDIVIDUAL', 1)
+SQL_CALL_INSERT_HOUSING = plsql_call_block('SP_INSERT_HOUSING', 11)
+SQL_CALL_UPDATE_HOUSING = plsql_call_block('SP_UPDATE_HOUSING', 9)
+SQL_CALL_DELETE_HOUSING = plsql_call_block('SP_DELETE_HOUSING', 1)
+SQL_CALL_INSERT_ECONOMIC_ACTIVITY = plsql_call_block('SP_INSERT_ECONOMIC_ACTIVITY', 10)
+SQL_CALL_GET_HOUSEHOLD_DEMOGRAPHICS = plsql_call_block('SP_GET_HOUSEHOLD_DEMOGRAPHICS', 2)
+SQL_CALL_GET_REGIONAL_STATISTICS = plsql_call_block('SP_GET_REGIONAL_STATISTICS', 2)
+SQL_CALL_GET_HOUSING_CONDITIONS = plsql_call_block('SP_GET_HOUSING_CONDITIONS', 2)
+SQL_CALL_GET_ACTIVITY_LOGS = plsql_call_block('SP_GET_ACTIVITY_LOGS', 5)
+
+# Highest issued primary key per table (index min/max scan)
+SQL_MAX_IDS = {
+    'GEOGRAPHICAL_INFO': "SELECT MAX(geo_id) as max_id FROM GEOGRAPHICAL_INFO",
+    'HOUSEHOLD': "SELECT MAX(household_id) as max_id FROM HOUSEHOLD",
+    'INDIVIDUAL': "SELECT MAX(individual_id) as max_id FROM INDIVIDUAL",
+    'HOUSING': "SELECT MAX(housing_id) as max_id FROM HOUSING",
+}
+
+# Search filter field -> WHERE condition binding the field under its own name
+SEARCH_FILTER_CONDITIONS = (
+    ('region_name', "g.region_name = :region_name"),
+    ('district_name', "g.district_name = :district_name"),
+    ('sex', "i.sex = :sex"),
+    ('min_age', "i.age >= :min_age"),
+    ('max_age', "i.age <= :max_age"),
+    ('marital_status', "i.marital_status = :marital_status"),
+    ('education_level', "i.highest_education_level = :education_level"),
+)
+
+SQL_SEARCH_FROM = """
+        FROM INDIVIDUAL i
+        JOIN HOUSEHOLD h ON i.household_id = h.household_id
+        JOIN GEOGRAPHICAL_INFO g ON h.geo_id = g.geo_id
+        """
+
+# Search SQL depends only on which filters are active, so each statement text is
+# built once per bitmask of active filters (bit i = SEARCH_FILTER_CONDITIONS[i])
+
+@functools.lru_cache(maxsize=None)
+def _search_where(mask: int) -> str:
+    """WHERE clause combining the conditions of the filters set in mask"""
+    return " AND ".join(condition for bit, (_, condition) in enumerate(SEARCH_FILTER_CONDITIONS)
+                        if mask >> bit & 1) or "1=1"
+
+@functools.lru_cache(maxsize=None)
+def _search_count_sql(mask: int) -> str:
+    """Statement counting the search matches for a filter mask"""
+    return f"""
+        SELECT COUNT(*) as total_count
+        {SQL_SEARCH_FROM}
+        WHERE {_search_where(mask)}
+        """
+
+@functools.lru_cache(maxsize=None)
+def _search_page_sql(mask: int, keyset: bool) -> str:
+    """Statement fetching one page of search matches for a filter mask"""
+    if keyset:
+        # Keyset pagination: seek past the previous page on the primary key
+        return f"""
+            SELECT i.*, g.region_name, g.district_name, g.locality_name
+            {SQL_SEARCH_FROM}
+            WHERE {_search_where(mask)} AND i.individual_id > :after_id
+            ORDER BY i.individual_id
+            FETCH FIRST :page_size ROWS ONLY
+            """
+    # Native row limiting lets the optimizer stop the join early
+    return f"""
+            SELECT i.*, g.region_name, g.district_name, g.locality_name
+            {SQL_SEARCH_FROM}
+            WHERE {_search_where(mask)}
+            ORDER BY i.individual_id
+            OFFSET :row_offset ROWS FETCH NEXT :page_size ROWS ONLY
+            """
+
+def _count_key(filters: SearchFilters) -> Tuple:
+    """Memo key for a search count: the value of every filter"""
+    return hashkey('count_individuals', *(getattr(filters, name) for name, _ in SEARCH_FILTER_CONDITIONS))
+
+def _isoformat_timestamp(row: Dict) -> Dict:
+    """Convert an activity log timestamp to string for JSON serialization"""
+    if row.get('OPERATION_TIMESTAMP'):
+        row['OPERATION_TIMESTAMP'] = row['OPERATION_TIMESTAMP'].isoformat()
+    return row
+
 class CensusService:
     """
     Service class to handle database operations for the Census system.
@@ -22,42 +254,57 @@ class CensusService:
     # =========================================
 
     @staticmethod
+    def _geographical_info_params(geo_data: GeographicalInfoCreate) -> List[Any]:
+        """Positional IN parameters for SP_INSERT_GEOGRAPHICAL_INFO"""
+        return [
+            geo_data.region_name,
+            geo_data.district_name,
+            geo_data.district_type,
+            geo_data.sub_district,
+            geo_data.locality_name,
+            geo_data.nhis_ecg_vra_number,
+            geo_data.detailed_address,
+            geo_data.contact_phone_1,
+            geo_data.contact_phone_2,
+            geo_data.enumeration_area_code,
+            geo_data.ea_type,
+            geo_data.locality_code,
+            geo_data.structure_number
+        ]
+
+    @staticmethod
+    @_clears_caches
     def create_geographical_info(geo_data: GeographicalInfoCreate) -> int:
         """Create geographical information using stored procedure"""
-        with DirectOracleConnection.get_connection() as connection:
+        with _write_connection() as connection:
             cursor = connection.cursor()
             geo_id = cursor.var(oracledb.DB_TYPE_NUMBER)
 
             try:
-                cursor.callproc('SP_INSERT_GEOGRAPHICAL_INFO', [
-                    geo_data.region_name,
-                    geo_data.district_name,
-                    geo_data.district_type,
-                    geo_data.sub_district,
-                    geo_data.locality_name,
-                    geo_data.nhis_ecg_vra_number,
-                    geo_data.detailed_address,
-                    geo_data.contact_phone_1,
-                    geo_data.contact_phone_2,
-                    geo_data.enumeration_area_code,
-                    geo_data.ea_type,
-                    geo_data.locality_code,
-                    geo_data.structure_number,
+                cursor.execute(SQL_CALL_INSERT_GEOGRAPHICAL_INFO, [
+                    *CensusService._geographical_info_params(geo_data),
                     geo_id
                 ])
-                connection.commit()
                 return geo_id.getvalue()
             finally:
                 cursor.close()
 
     @staticmethod
+    @_clears_caches
+    def create_geographical_info_bulk(geo_records: List[GeographicalInfoCreate]) -> List[int]:
+        """Create many geographical records with array-bound stored procedure calls"""
+        rows = [CensusService._geographical_info_params(g) for g in geo_records]
+        return DirectOracleConnection.execute_procedure_many('SP_INSERT_GEOGRAPHICAL_INFO', rows)
+
+    @staticmethod
+    @_clears_caches
     def update_geographical_info(geo_id: int, geo_data: GeographicalInfoUpdate) -> bool:
         """Update geographical information using stored procedure"""
-        with DirectOracleConnection.get_connection() as connection:
+        with _write_connection() as connection:
             cursor = connection.cursor()
 
             try:
-                cursor.callproc('SP_UPDATE_GEOGRAPHICAL_INFO', [
+                cursor.execute(SQL_CALL_UPDATE_GEOGRAPHICAL_INFO, [
                     geo_id,
                     geo_data.region_name,
                     geo_data.district_name,
@@ -68,40 +315,33 @@ class CensusService:
                     geo_data.contact_phone_1,
                     geo_data.contact_phone_2
                 ])
-                connection.commit()
                 return True
-            except Exception as e:
-                logger.error(f"Error updating geographical info: {e}")
+            except Exception:
+                logger.exception("Error updating geographical info")
                 return False
             finally:
                 cursor.close()
 
     @staticmethod
+    @_clears_caches
     def delete_geographical_info(geo_id: int) -> bool:
         """Delete geographical information using stored procedure"""
-        with DirectOracleConnection.get_connection() as connection:
+        with _write_connection() as connection:
             cursor = connection.cursor()
 
             try:
-                cursor.callproc('SP_DELETE_GEOGRAPHICAL_INFO', [geo_id])
-                connection.commit()
+                cursor.execute(SQL_CALL_DELETE_GEOGRAPHICAL_INFO, [geo_id])
                 return True
-            except Exception as e:
-                logger.error(f"Error deleting geographical info: {e}")
+            except Exception:
+                logger.exception("Error deleting geographical info")
                 return False
             finally:
                 cursor.close()
 
     @staticmethod
-    def get_geographical_info(geo_id: Optional[int] = None) -> List[Dict]:
-        """Get geographical information"""
-        sql = """
-        SELECT geo_id, region_name, district_name, district_type, sub_district,
-               locality_name, detailed_address, contact_phone_1, contact_phone_2,
-               date_created, created_by
-        FROM GEOGRAPHICAL_INFO
-        """
-
+    def _geographical_info_query(geo_id: Optional[int] = None) -> Tuple[str, Dict]:
+        """Build the geographical information query and its bind parameters"""
+        sql = SQL_GEOGRAPHICAL_INFO
         params = {}
         if geo_id:
             sql += " WHERE geo_id = :geo_id"
@@ -109,87 +349,97 @@ class CensusService:
 
         sql += " ORDER BY region_name, district_name"
 
-        return connection_manager.execute_raw_sql(sql, params)
+        return sql, params
+
+    @staticmethod
+    def get_geographical_info(geo_id: Optional[int] = None) -> List[Dict]:
+        """Get geographical information"""
+        sql, params = CensusService._geographical_info_query(geo_id)
+        return result_cache.cached_result(
+            'geographical_info', sql, params,
+            lambda: connection_manager.execute_raw_sql(sql, params)
+        )
 
     # =========================================
     # HOUSEHOLD SERVICES
     # =========================================
 
     @staticmethod
+    def _household_params(household_data: HouseholdCreate) -> List[Any]:
+        """Positional IN parameters for SP_INSERT_HOUSEHOLD"""
+        return [
+            *_HOUSEHOLD_FIELDS(household_data),
+            household_data.total_visits or 1,
+            household_data.form_number,
+            household_data.housing_unit_status or 'OCCUPIED'
+        ]
+
+    @staticmethod
+    @_clears_caches
     def create_household(household_data: HouseholdCreate) -> int:
         """Create household using stored procedure"""
-        with DirectOracleConnection.get_connection() as connection:
+        with _write_connection() as connection:
             cursor = connection.cursor()
             household_id = cursor.var(oracledb.DB_TYPE_NUMBER)
 
             try:
-                cursor.callproc('SP_INSERT_HOUSEHOLD', [
-                    household_data.geo_id,
-                    household_data.household_number_in_structure,
-                    household_data.type_of_residence,
-                    household_data.interview_date_started,
-                    household_data.interview_date_completed,
-                    household_data.total_visits or 1,
-                    household_data.form_number,
-                    household_data.housing_unit_status.value if household_data.housing_unit_status else 'OCCUPIED',
+                cursor.execute(SQL_CALL_INSERT_HOUSEHOLD, [
+                    *CensusService._household_params(household_data),
                     household_id
                 ])
-                connection.commit()
                 return household_id.getvalue()
             finally:
                 cursor.close()
 
     @staticmethod
+    @_clears_caches
+    def create_households_bulk(households: List[HouseholdCreate]) -> List[int]:
+        """Create many households with array-bound stored procedure calls"""
+        rows = [CensusService._household_params(h) for h in households]
+        return DirectOracleConnection.execute_procedure_many('SP_INSERT_HOUSEHOLD', rows)
+
+    @staticmethod
+    @_clears_caches
     def update_household(household_id: int, household_data: HouseholdUpdate) -> bool:
         """Update household using stored procedure"""
-        with DirectOracleConnection.get_connection() as connection:
+        with _write_connection() as connection:
             cursor = connection.cursor()
 
             try:
-                cursor.callproc('SP_UPDATE_HOUSEHOLD', [
+                cursor.execute(SQL_CALL_UPDATE_HOUSEHOLD, [
                     household_id,
                     household_data.type_of_residence,
                     household_data.interview_date_completed,
                     household_data.total_visits,
-                    household_data.housing_unit_status.value if household_data.housing_unit_status else None
+                    household_data.housing_unit_status
                 ])
-                connection.commit()
                 return True
-            except Exception as e:
-                logger.error(f"Error updating household: {e}")
+            except Exception:
+                logger.exception("Error updating household")
                 return False
             finally:
                 cursor.close()
 
     @staticmethod
+    @_clears_caches
     def delete_household(household_id: int) -> bool:
         """Delete household using stored procedure"""
-        with DirectOracleConnection.get_connection() as connection:
+        with _write_connection() as connection:
             cursor = connection.cursor()
 
             try:
-                cursor.callproc('SP_DELETE_HOUSEHOLD', [household_id])
-                connection.commit()
+                cursor.execute(SQL_CALL_DELETE_HOUSEHOLD, [household_id])
                 return True
-            except Exception as e:
-                logger.error(f"Error deleting household: {e}")
+            except Exception:
+                logger.exception("Error deleting household")
                 return False
             finally:
                 cursor.close()
 
     @staticmethod
-    def get_households(household_id: Optional[int] = None, geo_id: Optional[int] = None) -> List[Dict]:
-        """Get households with geographical information"""
-        sql = """
-        SELECT h.household_id, h.geo_id, h.household_number_in_structure,
-               h.type_of_residence, h.total_members, h.total_males, h.total_females,
-               h.housing_unit_status, h.interview_date_started, h.interview_date_completed,
-               g.region_name, g.district_name, g.locality_name
-        FROM HOUSEHOLD h
-        JOIN GEOGRAPHICAL_INFO g ON h.geo_id = g.geo_id
-        WHERE 1=1
-        """
-
+    def _households_query(household_id: Optional[int] = None, geo_id: Optional[int] = None) -> Tuple[str, Dict]:
+        """SQL and bind parameters for the households listing"""
+        sql = SQL_HOUSEHOLDS
         params = {}
         if household_id:
             sql += " AND h.household_id = :household_id"
@@ -199,7 +449,12 @@ class CensusService:
             params['geo_id'] = geo_id
 
         sql += " ORDER BY g.region_name, g.district_name, h.household_id"
+        return sql, params
 
+    @staticmethod
+    def get_households(household_id: Optional[int] = None, geo_id: Optional[int] = None) -> List[Dict]:
+        """Get households with geographical information"""
+        sql, params = CensusService._households_query(household_id, geo_id)
         return connection_manager.execute_raw_sql(sql, params)
 
     # =========================================
@@ -207,46 +462,72 @@ class CensusService:
     # =========================================
 
     @staticmethod
+    def _individual_params(individual_data: IndividualCreate) -> List[Any]:
+        """Positional IN parameters for SP_INSERT_INDIVIDUAL"""
+        return [
+            *_INDIVIDUAL_FIELDS(individual_data),
+            individual_data.status_on_census_night or 'PRESENT'
+        ]
+
+    @staticmethod
+    @_clears_caches
     def create_individual(individual_data: IndividualCreate) -> int:
         """Create individual using stored procedure"""
-        with DirectOracleConnection.get_connection() as connection:
+        with _write_connection() as connection:
             cursor = connection.cursor()
             individual_id = cursor.var(oracledb.DB_TYPE_NUMBER)
 
             try:
-                cursor.callproc('SP_INSERT_INDIVIDUAL', [
-                    individual_data.household_id,
-                    individual_data.person_line_number,
-                    individual_data.full_name,
-                    individual_data.relationship_to_head,
-                    individual_data.sex.value if individual_data.sex else None,
-                    individual_data.date_of_birth,
-                    individual_data.age,
-                    individual_data.nationality,
-                    individual_data.ethnicity,
-                    individual_data.religion,
-                    individual_data.marital_status,
-                    individual_data.highest_education_level,
-                    individual_data.status_on_census_night.value if individual_data.status_on_census_night else 'PRESENT',
+                cursor.execute(SQL_CALL_INSERT_INDIVIDUAL, [
+                    *CensusService._individual_params(individual_data),
                     individual_id
                 ])
-                connection.commit()
                 return individual_id.getvalue()
             finally:
                 cursor.close()
 
     @staticmethod
+    @_clears_caches
+    def create_individual_returning(individual_data: IndividualCreate) -> Dict:
+        """Create individual and return the stored row in the same round-trip"""
+        with _write_connection() as connection:
+            cursor = connection.cursor()
+            row_cursor = connection.cursor()
+
+            try:
+                params = {f"p{n}": value for n, value in
+                          enumerate(CensusService._individual_params(individual_data), start=1)}
+                params['individual_id'] = cursor.var(oracledb.DB_TYPE_NUMBER)
+                params['row_cursor'] = row_cursor
+                cursor.execute(SQL_CREATE_INDIVIDUAL_RETURNING, params)
+
+                # Lowercase keys to match the rows returned by get_individuals
+                dict_rows(row_cursor, lowercase=True)
+                return row_cursor.fetchone() or {}
+            finally:
+                row_cursor.close()
+                cursor.close()
+
+    @staticmethod
+    @_clears_caches
+    def create_individuals_bulk(individuals: List[IndividualCreate]) -> List[int]:
+        """Create many individuals with array-bound stored procedure calls"""
+        rows = [CensusService._individual_params(i) for i in individuals]
+        return DirectOracleConnection.execute_procedure_many('SP_INSERT_INDIVIDUAL', rows)
+
+    @staticmethod
+    @_clears_caches
     def update_individual(individual_id: int, individual_data: IndividualUpdate) -> bool:
         """Update individual using stored procedure"""
-        with DirectOracleConnection.get_connection() as connection:
+        with _write_connection() as connection:
             cursor = connection.cursor()
 
             try:
-                cursor.callproc('SP_UPDATE_INDIVIDUAL', [
+                cursor.execute(SQL_CALL_UPDATE_INDIVIDUAL, [
                     individual_id,
                     individual_data.full_name,
                     individual_data.relationship_to_head,
-                    individual_data.sex.value if individual_data.sex else None,
+                    individual_data.sex,
                     individual_data.age,
                     individual_data.nationality,
                     individual_data.ethnicity,
@@ -254,31 +535,39 @@ class CensusService:
                     individual_data.marital_status,
                     individual_data.highest_education_level
                 ])
-                connection.commit()
                 return True
-            except Exception as e:
-                logger.error(f"Error updating individual: {e}")
+            except Exception:
+                logger.exception("Error updating individual")
                 return False
             finally:
                 cursor.close()
 
     @staticmethod
+    @_clears_caches
     def delete_individual(individual_id: int) -> bool:
         """Delete individual using stored procedure"""
-        with DirectOracleConnection.get_connection() as connection:
+        with _write_connection() as connection:
             cursor = connection.cursor()
-            success = cursor.var(bool)
+
             try:
-                cursor.callproc('SP_DELETE_INDIVIDUAL', [individual_id, success])
-                return success.getvalue()
-            except oracledb.DatabaseError as e:
-                logger.error(f"Error deleting individual: {e}")
+                cursor.execute(SQL_CALL_DELETE_INDIVIDUAL, [individual_id])
+                return True
+            except Exception:
+                logger.exception("Error deleting individual")
                 return False
+            finally:
+                cursor.close()
 
     @staticmethod
-    def get_individuals(individual_id: Optional[int] = None, household_id: Optional[int] = None, limit: Optional[int] = None) -> List[Dict]:
-        """Retrieve individuals with optional filtering and limit"""
-        base_sql = "SELECT * FROM V_INDIVIDUAL_DETAILS"
+    def _individuals_query(individual_id: Optional[int] = None, household_id: Optional[int] = None,
+                           limit: Optional[int] = None,
+                           columns: Optional[Tuple[str, ...]] = None) -> Tuple[str, Dict]:
+        """SQL and bind parameters for the individuals listing (all columns unless projected)"""
+        if columns:
+            unknown = [c for c in columns if c.lower() not in INDIVIDUAL_COLUMNS]
+            if unknown:
+                raise ValueError(f"Unknown individual columns: {', '.join(unknown)}")
+        base_sql = SQL_INDIVIDUAL_DETAILS.format(columns=", ".join(columns) if columns else "*")
         filters = []
         params = {}
 
@@ -300,46 +589,77 @@ class CensusService:
             base_sql += " FETCH FIRST :limit ROWS ONLY"
             params['limit'] = limit
 
-        return connection_manager.execute_raw_sql(base_sql, params)
+        return base_sql, params
+
+    @staticmethod
+    def iter_individuals(individual_id: Optional[int] = None, household_id: Optional[int] = None,
+                         limit: Optional[int] = None,
+                         columns: Optional[List[str]] = None) -> Iterator[Dict]:
+        """Yield individuals lazily, fetching from the server in arraysize batches"""
+        sql, params = CensusService._individuals_query(
+            individual_id, household_id, limit, tuple(columns) if columns else None
+        )
+        yield from connection_manager.iter_raw_sql(sql, params)
+
+    @staticmethod
+    def get_individuals(individual_id: Optional[int] = None, household_id: Optional[int] = None, limit: Optional[int] = None,
+                        columns: Optional[List[str]] = None) -> List[Dict]:
+        """Retrieve individuals with optional filtering, limit and column projection"""
+        return list(CensusService.iter_individuals(individual_id, household_id, limit, columns))
 
     # =========================================
     # HOUSING SERVICES
     # =========================================
 
     @staticmethod
+    def _housing_params(housing_data: HousingCreate) -> List[Any]:
+        """Positional IN parameters for SP_INSERT_HOUSING"""
+        return [
+            housing_data.household_id,
+            housing_data.dwelling_type,
+            housing_data.outer_wall_material,
+            housing_data.floor_material,
+            housing_data.roof_material,
+            housing_data.rooms_occupied,
+            housing_data.rooms_for_sleeping,
+            housing_data.main_lighting_source,
+            housing_data.main_drinking_water_source,
+            housing_data.toilet_facility_type
+        ]
+
+    @staticmethod
+    @_clears_caches
     def create_housing(housing_data: HousingCreate) -> int:
         """Create housing information using stored procedure"""
-        with DirectOracleConnection.get_connection() as connection:
+        with _write_connection() as connection:
             cursor = connection.cursor()
             housing_id = cursor.var(oracledb.DB_TYPE_NUMBER)
 
             try:
-                cursor.callproc('SP_INSERT_HOUSING', [
-                    housing_data.household_id,
-                    housing_data.dwelling_type,
-                    housing_data.outer_wall_material,
-                    housing_data.floor_material,
-                    housing_data.roof_material,
-                    housing_data.rooms_occupied,
-                    housing_data.rooms_for_sleeping,
-                    housing_data.main_lighting_source,
-                    housing_data.main_drinking_water_source,
-                    housing_data.toilet_facility_type,
+                cursor.execute(SQL_CALL_INSERT_HOUSING, [
+                    *CensusService._housing_params(housing_data),
                     housing_id
                 ])
-                connection.commit()
                 return housing_id.getvalue()
             finally:
                 cursor.close()
 
     @staticmethod
+    @_clears_caches
+    def create_housing_bulk(housing_records: List[HousingCreate]) -> List[int]:
+        """Create many housing records with array-bound stored procedure calls"""
+        rows = [CensusService._housing_params(h) for h in housing_records]
+        return DirectOracleConnection.execute_procedure_many('SP_INSERT_HOUSING', rows)
+
+    @staticmethod
+    @_clears_caches
     def update_housing(housing_id: int, housing_data: HousingUpdate) -> bool:
         """Update housing information using stored procedure"""
-        with DirectOracleConnection.get_connection() as connection:
+        with _write_connection() as connection:
             cursor = connection.cursor()
 
             try:
-                cursor.callproc('SP_UPDATE_HOUSING', [
+                cursor.execute(SQL_CALL_UPDATE_HOUSING, [
                     housing_id,
                     housing_data.dwelling_type,
                     housing_data.outer_wall_material,
@@ -350,26 +670,25 @@ class CensusService:
                     housing_data.main_drinking_water_source,
                     housing_data.toilet_facility_type
                 ])
-                connection.commit()
                 return True
-            except Exception as e:
-                logger.error(f"Error updating housing: {e}")
+            except Exception:
+                logger.exception("Error updating housing")
                 return False
             finally:
                 cursor.close()
 
     @staticmethod
+    @_clears_caches
     def delete_housing(housing_id: int) -> bool:
         """Delete housing information using stored procedure"""
-        with DirectOracleConnection.get_connection() as connection:
+        with _write_connection() as connection:
             cursor = connection.cursor()
 
             try:
-                cursor.callproc('SP_DELETE_HOUSING', [housing_id])
-                connection.commit()
+                cursor.execute(SQL_CALL_DELETE_HOUSING, [housing_id])
                 return True
-            except Exception as e:
-                logger.error(f"Error deleting housing: {e}")
+            except Exception:
+                logger.exception("Error deleting housing")
                 return False
             finally:
                 cursor.close()
@@ -379,96 +698,120 @@ class CensusService:
     # =========================================
 
     @staticmethod
+    def _economic_activity_params(economic_data: EconomicActivityCreate) -> List[Any]:
+        """Positional IN parameters for SP_INSERT_ECONOMIC_ACTIVITY"""
+        return [
+            economic_data.individual_id,
+            economic_data.engaged_in_economic_activity or 'N',
+            *_ECONOMIC_ACTIVITY_FIELDS(economic_data),
+            economic_data.owns_mobile_phone or 'N',
+            economic_data.uses_internet or 'N'
+        ]
+
+    @staticmethod
+    @_clears_caches
     def create_economic_activity(economic_data: EconomicActivityCreate) -> int:
         """Create economic activity using stored procedure"""
-        with DirectOracleConnection.get_connection() as connection:
+        with _write_connection() as connection:
             cursor = connection.cursor()
             economic_id = cursor.var(oracledb.DB_TYPE_NUMBER)
 
             try:
-                cursor.callproc('SP_INSERT_ECONOMIC_ACTIVITY', [
-                    economic_data.individual_id,
-                    economic_data.engaged_in_economic_activity.value if economic_data.engaged_in_economic_activity else 'N',
-                    economic_data.occupation_description,
-                    economic_data.occupation_code,
-                    economic_data.workplace_name,
-                    economic_data.employment_status,
-                    economic_data.employment_sector,
-                    economic_data.owns_mobile_phone.value if economic_data.owns_mobile_phone else 'N',
-                    economic_data.uses_internet.value if economic_data.uses_internet else 'N',
+                cursor.execute(SQL_CALL_INSERT_ECONOMIC_ACTIVITY, [
+                    *CensusService._economic_activity_params(economic_data),
                     economic_id
                 ])
-                connection.commit()
                 return economic_id.getvalue()
             finally:
                 cursor.close()
 
+    @staticmethod
+    @_clears_caches
+    def create_economic_activities_bulk(economic_records: List[EconomicActivityCreate]) -> List[int]:
+        """Create many economic activity records with array-bound stored procedure calls"""
+        rows = [CensusService._economic_activity_params(e) for e in economic_records]
+        return DirectOracleConnection.execute_procedure_many('SP_INSERT_ECONOMIC_ACTIVITY', rows)
+
     # =========================================
     # COMPLEX QUERY SERVICES (using cursors)
     # =========================================
 
     @staticmethod
-    def get_household_demographics(household_id: int) -> List[Dict]:
-        """Get household demographics using cursor procedure"""
-        with DirectOracleConnection.get_connection() as connection:
-            cursor = connection.cursor()
-            result_cursor = connection.cursor()
+    def _iter_cursor_proc(call_sql: str, args: List[Any], batch_size: Optional[int] = None,
+                          convert: Optional[Callable[[Dict], Dict]] = None) -> Iterator[List[Dict]]:
+        """Call a procedure whose trailing OUT bind is a REF CURSOR; yield its rows in batches"""
+        with connection_manager.acquire() as connection:
+            with connection.cursor() as cursor, connection.cursor() as result_cursor:
+                if batch_size:
+                    result_cursor.arraysize = batch_size
+                cursor.execute(call_sql, [*args, result_cursor])
+
+                dict_rows(result_cursor, convert=convert)
+                while batch := result_cursor.fetchmany():
+                    yield batch
 
-            try:
-                cursor.callproc('SP_GET_HOUSEHOLD_DEMOGRAPHICS', [household_id, result_cursor])
+    @staticmethod
+    def _call_cursor_proc(call_sql: str, args: List[Any],
+                          convert: Optional[Callable[[Dict], Dict]] = None) -> List[Dict]:
+        """Call a REF CURSOR procedure and return all of its rows"""
+        return [row for batch in CensusService._iter_cursor_proc(call_sql, args, convert=convert)
+                for row in batch]
 
-                # Fetch results from cursor
-                columns = [desc[0] for desc in result_cursor.description]
-                results = []
-                for row in result_cursor:
-                    results.append(dict(zip(columns, row)))
+    @staticmethod
+    def fetch_rows_fast(call_sql: str, args: List[Any]) -> Tuple[List[str], List[tuple]]:
+        """Call a REF CURSOR procedure and return its column names and plain tuple rows"""
+        # For fixed-shape reports: skips building a dict per row
+        with connection_manager.acquire() as connection:
+            with connection.cursor() as cursor, connection.cursor() as result_cursor:
+                cursor.execute(call_sql, [*args, result_cursor])
+                columns = [d[0] for d in result_cursor.description]
+                return columns, result_cursor.fetchall()
 
-                return results
-            finally:
-                result_cursor.close()
-                cursor.close()
+    @staticmethod
+    def get_household_demographics(household_id: int) -> List[Dict]:
+        """Get household demographics using cursor procedure"""
+        return CensusService._call_cursor_proc(SQL_CALL_GET_HOUSEHOLD_DEMOGRAPHICS, [household_id])
 
     @staticmethod
+    @cached(_stats_cache, key=functools.partial(hashkey, 'regional_statistics'), lock=_stats_lock)
     def get_regional_statistics(region_name: Optional[str] = None) -> List[Dict]:
         """Get regional statistics using cursor procedure"""
-        with DirectOracleConnection.get_connection() as connection:
-            cursor = connection.cursor()
-            result_cursor = connection.cursor()
-
-            try:
-                cursor.callproc('SP_GET_REGIONAL_STATISTICS', [region_name, result_cursor])
-
-                # Fetch results from cursor
-                columns = [desc[0] for desc in result_cursor.description]
-                results = []
-                for row in result_cursor:
-                    results.append(dict(zip(columns, row)))
-
-                return results
-            finally:
-                result_cursor.close()
-                cursor.close()
+        return result_cache.cached_result(
+            'regional_statistics', SQL_CALL_GET_REGIONAL_STATISTICS, [region_name],
+            lambda: CensusService._call_cursor_proc(SQL_CALL_GET_REGIONAL_STATISTICS, [region_name])
+        )
 
     @staticmethod
+    @cached(_stats_cache, key=functools.partial(hashkey, 'housing_conditions'), lock=_stats_lock)
     def get_housing_conditions(district_name: Optional[str] = None) -> List[Dict]:
         """Get housing conditions using cursor procedure"""
-        with DirectOracleConnection.get_connection() as connection:
-            cursor = connection.cursor()
-            result_cursor = connection.cursor()
+        return result_cache.cached_result(
+            'housing_conditions', SQL_CALL_GET_HOUSING_CONDITIONS, [district_name],
+            lambda: CensusService.load_housing_conditions(district_name)
+        )
 
-            try:
-                cursor.callproc('SP_GET_HOUSING_CONDITIONS', [district_name, result_cursor])
+    @staticmethod
+    def load_housing_conditions(district_name: Optional[str] = None) -> List[Dict]:
+        """Get housing conditions straight from the database, bypassing every cache"""
+        return CensusService._call_cursor_proc(SQL_CALL_GET_HOUSING_CONDITIONS, [district_name])
 
-                # Fetch results from cursor
-                columns = [desc[0] for desc in result_cursor.description]
-                results = []
-                for row in result_cursor:
-                    results.append(dict(zip(columns, row)))
+    @staticmethod
+    @cached(_stats_cache, key=functools.partial(hashkey, 'regional_statistics:rows'), lock=_stats_lock)
+    def get_regional_statistics_rows(region_name: Optional[str] = None) -> Tuple[List[str], List[tuple]]:
+        """Get regional statistics as column names and tuple rows"""
+        return result_cache.cached_result(
+            'regional_statistics:rows', SQL_CALL_GET_REGIONAL_STATISTICS, [region_name],
+            lambda: CensusService.fetch_rows_fast(SQL_CALL_GET_REGIONAL_STATISTICS, [region_name])
+        )
 
-                return results
-            finally:
-                result_cursor.close()
-                cursor.close()
+    @staticmethod
+    @cached(_stats_cache, key=functools.partial(hashkey, 'housing_conditions:rows'), lock=_stats_lock)
+    def get_housing_conditions_rows(district_name: Optional[str] = None) -> Tuple[List[str], List[tuple]]:
+        """Get housing conditions as column names and tuple rows"""
+        return result_cache.cached_result(
+            'housing_conditions:rows', SQL_CALL_GET_HOUSING_CONDITIONS, [district_name],
+            lambda: CensusService.fetch_rows_fast(SQL_CALL_GET_HOUSING_CONDITIONS, [district_name])
+        )
 
     # =========================================
     # ACTIVITY LOG SERVICES
@@ -480,118 +823,237 @@ class CensusService:
                         user_name: Optional[str] = None,
                         days_back: int = 7) -> List[Dict]:
         """Get activity log using cursor procedure"""
-        with DirectOracleConnection.get_connection() as connection:
-            cursor = connection.cursor()
-            result_cursor = connection.cursor()
+        return CensusService._call_cursor_proc(
+            SQL_CALL_GET_ACTIVITY_LOGS, [table_name, operation_type, user_name, days_back],
+            convert=_isoformat_timestamp
+        )
 
-            try:
-                cursor.callproc('SP_GET_ACTIVITY_LOGS', [
-                    table_name, operation_type, user_name, days_back, result_cursor
-                ])
+    @staticmethod
+    def iter_activity_log(table_name: Optional[str] = None,
+                          operation_type: Optional[str] = None,
+                          user_name: Optional[str] = None,
+                          days_back: int = 7,
+                          batch_size: int = 500) -> Iterator[List[Dict]]:
+        """Yield activity log rows in batches while the procedure cursor stays open"""
+        yield from CensusService._iter_cursor_proc(
+            SQL_CALL_GET_ACTIVITY_LOGS, [table_name, operation_type, user_name, days_back],
+            batch_size=batch_size, convert=_isoformat_timestamp
+        )
 
-                # Fetch results from cursor
-                columns = [desc[0] for desc in result_cursor.description]
-                results = []
-                for row in result_cursor:
-                    row_dict = dict(zip(columns, row))
-                    # Convert timestamp to string for JSON serialization
-                    if 'OPERATION_TIMESTAMP' in row_dict and row_dict['OPERATION_TIMESTAMP']:
-                        row_dict['OPERATION_TIMESTAMP'] = row_dict['OPERATION_TIMESTAMP'].isoformat()
-                    results.append(row_dict)
-
-                return results
-            finally:
-                result_cursor.close()
-                cursor.close()
+    # =========================================
+    # DATAFRAME SERVICES
+    # =========================================
+
+    @staticmethod
+    def _query_frame(sql: str, params: Dict, limit: int, offset: int = 0):
+        """Fetch one window of a listing into pandas through oracledb's Arrow path"""
+        import pandas as pd
+        import pyarrow
+
+        sql += " OFFSET :row_offset ROWS FETCH NEXT :row_limit ROWS ONLY"
+        with connection_manager.acquire() as connection:
+            oracle_frame = connection.fetch_df_all(sql, {**params, 'row_offset': offset, 'row_limit': limit})
+
+        # Columns stay Arrow-backed; names lowercased to match execute_raw_sql rows
+        frame = pyarrow.table(oracle_frame).to_pandas(types_mapper=pd.ArrowDtype)
+        frame.columns = frame.columns.str.lower()
+        return frame
+
+    @staticmethod
+    def get_geographical_info_frame(limit: int = 1000, offset: int = 0):
+        """Geographical information as a DataFrame, one window at a time"""
+        sql, params = CensusService._geographical_info_query()
+        return CensusService._query_frame(sql, params, limit, offset)
+
+    @staticmethod
+    def get_households_frame(limit: int = 1000, offset: int = 0):
+        """Households with geographical information as a DataFrame, one window at a time"""
+        sql, params = CensusService._households_query()
+        return CensusService._query_frame(sql, params, limit, offset)
+
+    @staticmethod
+    def get_individuals_frame(limit: int = 1000, offset: int = 0):
+        """Individuals as a DataFrame, one window at a time"""
+        sql, params = CensusService._individuals_query()
+        return CensusService._query_frame(sql, params, limit, offset)
 
     # =========================================
     # UTILITY SERVICES
     # =========================================
 
     @staticmethod
-    def get_database_statistics() -> Dict[str, Any]:
-        """Get general database statistics"""
-        sql = """
-        SELECT 
-            (SELECT COUNT(*) FROM GEOGRAPHICAL_INFO) as total_geographical_areas,
-            (SELECT COUNT(*) FROM HOUSEHOLD) as total_households,
-            (SELECT COUNT(*) FROM INDIVIDUAL) as total_individuals,
-            (SELECT COUNT(*) FROM HOUSING) as total_housing_records,
-            (SELECT COUNT(*) FROM ECONOMIC_ACTIVITY) as total_economic_records,
-            (SELECT COUNT(*) FROM ACTIVITY_LOG) as total_log_entries
-        FROM DUAL
-        """
+    @cached(_stats_cache, key=functools.partial(hashkey, 'database_statistics'), lock=_stats_lock)
+    def get_database_statistics(exact: bool = False) -> Dict[str, Any]:
+        """Get general database statistics (optimizer estimates unless exact)"""
+        if not exact:
+            rows = connection_manager.execute_raw_sql(SQL_TABLE_ROW_ESTIMATES)
+            estimates = {STATISTICS_KEYS[row['table_name']]: row['num_rows'] for row in rows}
+            # Tables never analyzed report NULL; count them for real instead
+            if len(estimates) == len(STATISTICS_KEYS) and None not in estimates.values():
+                return {key: int(value) for key, value in estimates.items()}
+
+        result = connection_manager.execute_raw_sql(SQL_DATABASE_STATISTICS)
+        # NUMBER columns may come back as Decimal; callers add these up
+        return {key: int(value) if value is not None else None
+                for key, value in result[0].items()} if result else {}
+
+    @staticmethod
+    def get_max_id(table_name: str) -> int:
+        """Highest primary key currently stored in table_name"""
+        result = connection_manager.execute_raw_sql(SQL_MAX_IDS[table_name])
+        return (result[0]['max_id'] or 0) if result else 0
+
+    @staticmethod
+    def _data_version_query(tables: Tuple[str, ...]) -> Tuple[str, Dict]:
+        """SQL and bind parameters summing the DATA_VERSION counters of tables (all when empty)"""
+        sql = "SELECT NVL(SUM(version), 0) as version FROM DATA_VERSION"
+        params = {f"t{n}": table for n, table in enumerate(tables)}
+        if params:
+            sql += " WHERE table_name IN (" + ", ".join(f":{name}" for name in params) + ")"
+        return sql, params
+
+    @staticmethod
+    def get_data_version(tables: Tuple[str, ...] = ()) -> int:
+        """Change counter for tables (all when empty); moves whenever a write to them commits"""
+        sql, params = CensusService._data_version_query(tables)
+        result = connection_manager.execute_raw_sql(sql, params)
+        return int(result[0]['version']) if result else 0
 
-        result = connection_manager.execute_raw_sql(sql)
-        return result[0] if result else {}
+    @staticmethod
+    def get_mview_last_refresh(mview_name: str) -> int:
+        """Microsecond timestamp of a materialized view's last refresh"""
+        sql = "SELECT last_refresh_date FROM USER_MVIEWS WHERE mview_name = :mview_name"
+        result = connection_manager.execute_raw_sql(sql, {'mview_name': mview_name})
+        last_refresh = result[0]['last_refresh_date'] if result else None
+        return int(last_refresh.timestamp() * 1_000_000) if last_refresh else 0
 
     @staticmethod
-    def search_individuals(filters: SearchFilters, pagination: PaginationParams) -> Tuple[List[Dict], int]:
-        """Search individuals with filters and pagination"""
-        # Build WHERE clause based on filters
-        where_conditions = []
+    def _search_conditions(filters: SearchFilters) -> Tuple[int, Dict]:
+        """Bitmask of the active search filters and their bind parameters"""
+        mask = 0
         params = {}
+        for bit, (name, _) in enumerate(SEARCH_FILTER_CONDITIONS):
+            value = getattr(filters, name)
+            if value is not None and value != '':
+                mask |= 1 << bit
+                params[name] = value
+        return mask, params
 
-        if filters.region_name:
-            where_conditions.append("g.region_name = :region_name")
-            params['region_name'] = filters.region_name
+    @staticmethod
+    def _count_query(filters: SearchFilters) -> Tuple[str, Dict]:
+        """SQL and bind parameters counting the search matches"""
+        mask, params = CensusService._search_conditions(filters)
+        return _search_count_sql(mask), params
 
-        if filters.district_name:
-            where_conditions.append("g.district_name = :district_name")
-            params['district_name'] = filters.district_name
+    @staticmethod
+    def _search_query(filters: SearchFilters, pagination: PaginationParams,
+                      extra_row: bool = False) -> Tuple[str, Dict]:
+        """SQL and bind parameters for one page of search results (plus one row to detect a next page)"""
+        mask, params = CensusService._search_conditions(filters)
+
+        keyset = pagination.after_id is not None
+        data_sql = _search_page_sql(mask, keyset)
+        if keyset:
+            params['after_id'] = pagination.after_id
+        else:
+            params['row_offset'] = pagination.offset
+
+        # Pages are at most 101 rows, within the driver's default prefetch, so the
+        # whole page arrives with the execute round-trip
+        params['page_size'] = pagination.size + 1 if extra_row else pagination.size
+        return data_sql, params
 
-        if filters.sex:
-            where_conditions.append("i.sex = :sex")
-            params['sex'] = filters.sex.value
+    @staticmethod
+    @cached(_stats_cache, key=_count_key, lock=_stats_lock)
+    def count_individuals(filters: SearchFilters) -> int:
+        """Count individuals matching the search filters"""
+        count_sql, params = CensusService._count_query(filters)
+        count_result = connection_manager.execute_raw_sql(count_sql, params)
+        return count_result[0]['total_count'] if count_result else 0
 
-        if filters.min_age is not None:
-            where_conditions.append("i.age >= :min_age")
-            params['min_age'] = filters.min_age
+    @staticmethod
+    def search_individuals_page(filters: SearchFilters, pagination: PaginationParams,
+                                include_total: bool = False) -> Tuple[List[Dict], bool, Optional[int]]:
+        """Search one page, reporting whether another follows; the total is counted only on request"""
+        data_sql, params = CensusService._search_query(filters, pagination, extra_row=True)
 
-        if filters.max_age is not None:
-            where_conditions.append("i.age <= :max_age")
-            params['max_age'] = filters.max_age
+        count_future = _query_executor.submit(CensusService.count_individuals, filters) if include_total else None
+        rows = connection_manager.execute_raw_sql(data_sql, params)
+        total_count = count_future.result() if count_future else None
 
-        if filters.marital_status:
-            where_conditions.append("i.marital_status = :marital_status")
-            params['marital_status'] = filters.marital_status
+        return rows[:pagination.size], len(rows) > pagination.size, total_count
 
-        if filters.education_level:
-            where_conditions.append("i.highest_education_level = :education_level")
-            params['education_level'] = filters.education_level
+class AsyncCensusService:
+    """
+    Async variants of read services, backed by oracledb's asyncio pool.
+    """
 
-        where_clause = " AND ".join(where_conditions) if where_conditions else "1=1"
+    @staticmethod
+    async def get_data_version(tables: Tuple[str, ...] = ()) -> int:
+        """Change counter for tables (all when empty); moves whenever a write to them commits"""
+        sql, params = CensusService._data_version_query(tables)
+        result = await AsyncOracleConnection.execute_raw_sql(sql, params)
+        return int(result[0]['version']) if result else 0
 
-        # Count query
-        count_sql = f"""
-        SELECT COUNT(*) as total_count
-        FROM INDIVIDUAL i
-        JOIN HOUSEHOLD h ON i.household_id = h.household_id
-        JOIN GEOGRAPHICAL_INFO g ON h.geo_id = g.geo_id
-        WHERE {where_clause}
-        """
+    @staticmethod
+    async def get_statistics_last_analyzed() -> int:
+        """Microsecond timestamp of the newest optimizer statistics behind the row estimates"""
+        result = await AsyncOracleConnection.execute_raw_sql(SQL_STATISTICS_LAST_ANALYZED)
+        last_analyzed = result[0]['last_analyzed'] if result else None
+        return int(last_analyzed.timestamp() * 1_000_000) if last_analyzed else 0
 
-        count_result = connection_manager.execute_raw_sql(count_sql, params)
-        total_count = count_result[0]['TOTAL_COUNT'] if count_result else 0
-
-        # Data query with pagination
-        data_sql = f"""
-        SELECT * FROM (
-            SELECT i.*, g.region_name, g.district_name, g.locality_name,
-                   ROW_NUMBER() OVER (ORDER BY i.individual_id) as rn
-            FROM INDIVIDUAL i
-            JOIN HOUSEHOLD h ON i.household_id = h.household_id
-            JOIN GEOGRAPHICAL_INFO g ON h.geo_id = g.geo_id
-            WHERE {where_clause}
-        ) WHERE rn BETWEEN :start_row AND :end_row
-        """
+    @staticmethod
+    async def get_geographical_info(geo_id: Optional[int] = None) -> List[Dict]:
+        """Get geographical information"""
+        sql, params = CensusService._geographical_info_query(geo_id)
+        return await AsyncOracleConnection.execute_raw_sql(sql, params)
 
-        params['start_row'] = pagination.offset + 1
-        params['end_row'] = pagination.offset + pagination.size
+    @staticmethod
+    async def get_households(household_id: Optional[int] = None, geo_id: Optional[int] = None) -> List[Dict]:
+        """Get households with geographical information"""
+        sql, params = CensusService._households_query(household_id, geo_id)
+        return await AsyncOracleConnection.execute_raw_sql(sql, params)
 
-        data_result = connection_manager.execute_raw_sql(data_sql, params)
+    @staticmethod
+    async def get_individuals(individual_id: Optional[int] = None, household_id: Optional[int] = None,
+                              limit: Optional[int] = None, columns: Optional[List[str]] = None) -> List[Dict]:
+        """Retrieve individuals with optional filtering, limit and column projection"""
+        sql, params = CensusService._individuals_query(
+            individual_id, household_id, limit, tuple(columns) if columns else None
+        )
+        return await AsyncOracleConnection.execute_raw_sql(sql, params)
+
+    @staticmethod
+    async def get_regional_statistics(region_name: Optional[str] = None) -> List[Dict]:
+        """Get regional statistics using cursor procedure"""
+        return await AsyncOracleConnection.execute_cursor_call(
+            SQL_CALL_GET_REGIONAL_STATISTICS, [region_name]
+        )
 
-        return data_result, total_count
+    @staticmethod
+    async def count_individuals(filters: SearchFilters) -> int:
+        """Count individuals matching the search filters"""
+        key = _count_key(filters)
+        with _stats_lock:
+            total_count = _stats_cache.get(key)
+        if total_count is not None:
+            return total_count
+
+        count_sql, params = CensusService._count_query(filters)
+        count_result = await AsyncOracleConnection.execute_raw_sql(count_sql, params)
+        total_count = count_result[0]['total_count'] if count_result else 0
+        with _stats_lock:
+            _stats_cache[key] = total_count
+        return total_count
 
-# Global service instance
+    @staticmethod
+    async def search_individuals_page(filters: SearchFilters,
+                                      pagination: PaginationParams) -> Tuple[List[Dict], bool]:
+        """Search one page, reporting whether another follows"""
+        data_sql, params = CensusService._search_query(filters, pagination, extra_row=True)
+        rows = await AsyncOracleConnection.execute_raw_sql(data_sql, params)
+        return rows[:pagination.size], len(rows) > pagination.size
+
+# Global service instances
 census_service = CensusService()
+async_census_service = AsyncCensusService()
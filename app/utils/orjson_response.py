@@ -0,0 +1,32 @@
+# =========================================
+# ORJSON RESPONSE CLASS
+# Census Database Management System - Oracle Edition
+# =========================================
+
+import decimal
+from typing import Any
+
+import oracledb
+import orjson
+from fastapi.responses import JSONResponse
+
+_OPTIONS = orjson.OPT_SERIALIZE_NUMPY
+
+def _default(value: Any) -> Any:
+    """Convert Oracle result types orjson does not serialize natively"""
+    if isinstance(value, decimal.Decimal):
+        return float(value)
+    if isinstance(value, oracledb.LOB):
+        return value.read()
+    raise TypeError(f"Type is not JSON serializable: {type(value).__name__}")
+
+def dumps(content: Any) -> bytes:
+    """Serialize content exactly as ORJSONResponse renders it"""
+    return orjson.dumps(content, default=_default, option=_OPTIONS)
+
+class ORJSONResponse(JSONResponse):
+    """JSON response rendered by orjson in a single pass over the content"""
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
@@ -0,0 +1,71 @@
+# =========================================
+# PERSISTENT QUERY RESULT CACHE
+# Census Database Management System - Oracle Edition
+# =========================================
+
+import hashlib
+from typing import Any, Callable, Optional
+import logging
+
+from config.oracle_config import settings
+
+logger = logging.getLogger(__name__)
+
+_cache = None
+
+def get_cache():
+    """Open the disk cache on first use; None when CACHE_DIR is not configured"""
+    global _cache
+    if _cache is None and settings.CACHE_DIR:
+        import diskcache
+        _cache = diskcache.Cache(settings.CACHE_DIR)
+    return _cache
+
+def result_key(tag: str, sql: str, params: Any = None) -> str:
+    """Stable key for a result shape (tag), a statement and its bind values"""
+    if isinstance(params, dict):
+        params = sorted(params.items())
+    return hashlib.blake2b((tag + "\0" + sql + repr(params)).encode(), digest_size=20).hexdigest()
+
+def cached_result(tag: str, sql: str, params: Any, loader: Callable[[], Any],
+                  ttl: Optional[int] = None) -> Any:
+    """Return the stored result for tag+sql+params, calling loader and storing it on a miss"""
+    cache = get_cache()
+    if cache is None:
+        return loader()
+
+    key = result_key(tag, sql, params)
+    try:
+        hit = cache.get(key)
+        if hit is not None:
+            return hit
+    except Exception as e:
+        logger.warning("Result cache read failed for %s: %s", tag, e)
+
+    value = loader()
+
+    try:
+        cache.set(key, value, expire=ttl or settings.RESULT_CACHE_TTL, tag=tag)
+    except Exception as e:
+        logger.warning("Result cache write failed for %s: %s", tag, e)
+    return value
+
+def evict(tag: Optional[str] = None) -> None:
+    """Drop the entries stored under tag, or every entry when no tag is given"""
+    cache = get_cache()
+    if cache is None:
+        return
+    try:
+        if tag is None:
+            cache.clear()
+        else:
+            cache.evict(tag)
+    except Exception as e:
+        logger.warning("Result cache eviction failed for %s: %s", tag or "all entries", e)
+
+def close() -> None:
+    """Close the disk cache"""
+    global _cache
+    if _cache is not None:
+        _cache.close()
+        _cache = None
@@ -0,0 +1 @@
+"""Python package initialization file for cli/commands"""
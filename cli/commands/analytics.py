@@ -0,0 +1,76 @@
+# =========================================
+# ANALYTICS COMMANDS
+# Census Database Management System - Oracle Edition
+# =========================================
+
+import click
+
+from cli.utils import CensusGroup, console, print_error, print_rows, print_table
+
+@click.group(cls=CensusGroup)
+def analytics():
+    """View analytics and reports"""
+    pass
+
+@analytics.command()
+@click.option('--household-id', required=True, type=int, help='Household ID')
+def demographics(household_id):
+    """View household demographics"""
+    from app.utils.db_service import census_service
+    try:
+        data = census_service.get_household_demographics(household_id)
+        print_table(data, f"Household {household_id} Demographics")
+
+    except Exception as e:
+        print_error(f"Error retrieving household demographics: {e}")
+
+@analytics.command()
+@click.option('--region', help='Region name filter')
+def regional_stats(region):
+    """View regional statistics"""
+    from app.utils.db_service import census_service
+    try:
+        columns, rows = census_service.get_regional_statistics_rows(region)
+        print_rows(columns, rows, f"Regional Statistics{' - ' + region if region else ''}")
+
+    except Exception as e:
+        print_error(f"Error retrieving regional statistics: {e}")
+
+@analytics.command()
+@click.option('--district', help='District name filter')
+def housing_conditions(district):
+    """View housing conditions"""
+    from app.utils.db_service import census_service
+    try:
+        columns, rows = census_service.get_housing_conditions_rows(district)
+        print_rows(columns, rows, f"Housing Conditions{' - ' + district if district else ''}")
+
+    except Exception as e:
+        print_error(f"Error retrieving housing conditions: {e}")
+
+@analytics.command()
+@click.option('--exact', is_flag=True, help='Count every table instead of using optimizer statistics')
+def database_stats(exact):
+    """View database statistics"""
+    from rich.panel import Panel
+    from app.utils.db_service import census_service
+    try:
+        data = census_service.get_database_statistics(exact=exact)
+
+        # Format statistics nicely
+        console.print(Panel.fit(
+            f"""Database Statistics{'' if exact else ' (estimated)'}:
+
+📊 Total Geographical Areas: {data.get('total_geographical_areas', 0)}
+🏠 Total Households: {data.get('total_households', 0)}
+👥 Total Individuals: {data.get('total_individuals', 0)}
+🏘️  Total Housing Records: {data.get('total_housing_records', 0)}
+💼 Total Economic Records: {data.get('total_economic_records', 0)}
+📝 Total Activity Log Entries: {data.get('total_log_entries', 0)}
+            """,
+            title="Census Database Statistics",
+            style="green"
+        ))
+
+    except Exception as e:
+        print_error(f"Error retrieving database statistics: {e}")
@@ -0,0 +1,52 @@
+# =========================================
+# GEOGRAPHICAL INFORMATION COMMANDS
+# Census Database Management System - Oracle Edition
+# =========================================
+
+import click
+
+from cli.utils import CensusGroup, print_error, print_success, safe_print_table, type_adapter
+
+@click.group(cls=CensusGroup)
+def geo():
+    """Manage geographical information"""
+    pass
+
+@geo.command()
+@click.option('--region', required=True, help='Region name')
+@click.option('--district', required=True, help='District name') 
+@click.option('--district-type', help='District type')
+@click.option('--locality', help='Locality name')
+@click.option('--address', help='Detailed address')
+@click.option('--phone', help='Contact phone number')
+def create(region, district, district_type, locality, address, phone):
+    """Create new geographical information"""
+    from app.utils.db_service import census_service
+    from app.models.pydantic_models import GeographicalInfoCreate
+    try:
+        geo_data = type_adapter(GeographicalInfoCreate).validate_python({
+            'region_name': region,
+            'district_name': district,
+            'district_type': district_type,
+            'locality_name': locality,
+            'detailed_address': address,
+            'contact_phone_1': phone
+        })
+
+        geo_id = census_service.create_geographical_info(geo_data)
+        print_success(f"Geographical information created with ID: {geo_id}")
+
+    except Exception as e:
+        print_error(f"Error creating geographical information: {e}")
+
+@geo.command(name='list')
+@click.option('--geo-id', type=int, help='Geographical information ID')
+def list_geo(geo_id):
+    """List geographical information"""
+    from app.utils.db_service import census_service
+    try:
+        data = census_service.get_geographical_info(geo_id)
+        safe_print_table(data, "Geographical Information")
+
+    except Exception as e:
+        print_error(f"Error retrieving geographical information: {e}")
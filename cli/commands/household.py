@@ -0,0 +1,51 @@
+# =========================================
+# HOUSEHOLD COMMANDS
+# Census Database Management System - Oracle Edition
+# =========================================
+
+import click
+from datetime import date
+
+from cli.utils import CensusGroup, print_error, print_success, safe_print_table, type_adapter
+
+@click.group(cls=CensusGroup)
+def household():
+    """Manage households"""
+    pass
+
+@household.command()
+@click.option('--geo-id', required=True, type=int, help='Geographical information ID')
+@click.option('--household-number', help='Household number in structure')
+@click.option('--residence-type', help='Type of residence')
+@click.option('--form-number', help='Form number')
+def create(geo_id, household_number, residence_type, form_number):
+    """Create new household"""
+    from app.utils.db_service import census_service
+    from app.models.pydantic_models import HouseholdCreate
+    try:
+        household_data = type_adapter(HouseholdCreate).validate_python({
+            'geo_id': geo_id,
+            'household_number_in_structure': household_number,
+            'type_of_residence': residence_type,
+            'form_number': form_number,
+            'interview_date_started': date.today()
+        })
+
+        household_id = census_service.create_household(household_data)
+        print_success(f"Household created with ID: {household_id}")
+
+    except Exception as e:
+        print_error(f"Error creating household: {e}")
+
+@household.command(name='list')
+@click.option('--household-id', type=int, help='Household ID')
+@click.option('--geo-id', type=int, help='Geographical information ID')
+def list_households(household_id, geo_id):
+    """List households"""
+    from app.utils.db_service import census_service
+    try:
+        data = census_service.get_households(household_id, geo_id)
+        safe_print_table(data, "Households")
+
+    except Exception as e:
+        print_error(f"Error retrieving households: {e}")
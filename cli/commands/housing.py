@@ -0,0 +1,46 @@
+# =========================================
+# HOUSING COMMANDS
+# Census Database Management System - Oracle Edition
+# =========================================
+
+import click
+
+from cli.utils import CensusGroup, print_error, print_success, type_adapter
+
+@click.group(cls=CensusGroup)
+def housing():
+    """Manage housing information"""
+    pass
+
+@housing.command()
+@click.option('--household-id', required=True, type=int, help='Household ID')
+@click.option('--dwelling-type', help='Type of dwelling')
+@click.option('--wall-material', help='Outer wall material')
+@click.option('--floor-material', help='Floor material')
+@click.option('--roof-material', help='Roof material')
+@click.option('--rooms', type=int, help='Number of rooms occupied')
+@click.option('--lighting', help='Main lighting source')
+@click.option('--water-source', help='Main drinking water source')
+@click.option('--toilet-type', help='Type of toilet facility')
+def create(household_id, dwelling_type, wall_material, floor_material, roof_material, rooms, lighting, water_source, toilet_type):
+    """Create housing information"""
+    from app.utils.db_service import census_service
+    from app.models.pydantic_models import HousingCreate
+    try:
+        housing_data = type_adapter(HousingCreate).validate_python({
+            'household_id': household_id,
+            'dwelling_type': dwelling_type,
+            'outer_wall_material': wall_material,
+            'floor_material': floor_material,
+            'roof_material': roof_material,
+            'rooms_occupied': rooms,
+            'main_lighting_source': lighting,
+            'main_drinking_water_source': water_source,
+            'toilet_facility_type': toilet_type
+        })
+
+        housing_id = census_service.create_housing(housing_data)
+        print_success(f"Housing information created with ID: {housing_id}")
+
+    except Exception as e:
+        print_error(f"Error creating housing information: {e}")
@@ -0,0 +1,91 @@
+# =========================================
+# INDIVIDUAL COMMANDS
+# Census Database Management System - Oracle Edition
+# =========================================
+
+import click
+import itertools
+from typing import List
+
+from cli.utils import CensusGroup, print_error, print_info, print_success, safe_print_table, type_adapter
+
+@click.group(cls=CensusGroup)
+def individual():
+    """Manage individuals"""
+    pass
+
+@individual.command()
+@click.option('--household-id', required=True, type=int, help='Household ID')
+@click.option('--name', required=True, help='Full name')
+@click.option('--relationship', help='Relationship to head')
+@click.option('--sex', type=click.Choice(['M', 'F']), help='Sex (M/F)')
+@click.option('--age', type=int, help='Age')
+@click.option('--nationality', help='Nationality')
+@click.option('--ethnicity', help='Ethnicity')
+@click.option('--religion', help='Religion')
+@click.option('--marital-status', help='Marital status')
+@click.option('--education', help='Highest education level')
+def create(household_id, name, relationship, sex, age, nationality, ethnicity, religion, marital_status, education):
+    """Create new individual"""
+    from app.utils.db_service import census_service
+    from app.models.pydantic_models import IndividualCreate
+    try:
+        individual_data = type_adapter(IndividualCreate).validate_python({
+            'household_id': household_id,
+            'full_name': name,
+            'relationship_to_head': relationship,
+            'sex': sex,
+            'age': age,
+            'nationality': nationality,
+            'ethnicity': ethnicity,
+            'religion': religion,
+            'marital_status': marital_status,
+            'highest_education_level': education
+        })
+
+        individual_id = census_service.create_individual(individual_data)
+        print_success(f"Individual created with ID: {individual_id}")
+
+    except Exception as e:
+        print_error(f"Error creating individual: {e}")
+
+@individual.command(name='create-bulk')
+@click.option('--csv', 'csv_file', required=True, type=click.File('r', encoding='utf-8'),
+              help='CSV file, one individual per row, columns named like the API fields')
+@click.option('--batch-size', default=500, help='Rows inserted per round trip')
+def create_bulk(csv_file, batch_size):
+    """Create individuals from a CSV file with array-bound inserts"""
+    import csv
+    from app.utils.db_service import census_service
+    from app.models.pydantic_models import IndividualCreate
+
+    total = 0
+    try:
+        reader = csv.DictReader(csv_file)
+        while chunk := list(itertools.islice(reader, batch_size)):
+            # Empty cells mean "not provided"; unknown columns are ignored by the model
+            rows = [{key.strip(): value or None for key, value in row.items() if key} for row in chunk]
+            individuals = type_adapter(List[IndividualCreate]).validate_python(rows)
+            total += len(census_service.create_individuals_bulk(individuals))
+            print_info(f"Inserted {total} individuals")
+
+        print_success(f"Created {total} individuals")
+
+    except Exception as e:
+        print_error(f"Error creating individuals after {total} were committed: {e}")
+
+@individual.command(name='list')
+@click.option('--individual-id', type=int, help='Individual ID')
+@click.option('--household-id', type=int, help='Household ID')
+@click.option('--columns', help='Comma-separated columns to show, e.g. individual_id,full_name,age')
+@click.option('--limit', type=int, help='Show only the newest N individuals')
+def list_individuals(individual_id, household_id, columns, limit):
+    """List individuals"""
+    from app.utils.db_service import census_service
+    try:
+        columns = [c.strip() for c in columns.split(',') if c.strip()] if columns else None
+        data = census_service.get_individuals(individual_id, household_id, limit, columns=columns)
+        safe_print_table(data, "Individuals", hint="narrow the filters or pass --limit")
+
+    except Exception as e:
+        print_error(f"Error retrieving individuals: {e}")
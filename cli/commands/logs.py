@@ -0,0 +1,34 @@
+# =========================================
+# ACTIVITY LOG COMMANDS
+# Census Database Management System - Oracle Edition
+# =========================================
+
+import click
+import itertools
+from contextlib import closing
+
+from cli.utils import CensusGroup, print_error, print_table_streaming
+
+@click.group(cls=CensusGroup)
+def logs():
+    """View activity logs"""
+    pass
+
+@logs.command()
+@click.option('--table', help='Table name filter')
+@click.option('--operation', type=click.Choice(['INSERT', 'UPDATE', 'DELETE']), help='Operation type')
+@click.option('--user', help='User name filter')
+@click.option('--days', default=7, help='Days back to search')
+@click.option('--max-rows', default=1000, help='Rows to display (0 for all)')
+def activity(table, operation, user, days, max_rows):
+    """View recent activity logs"""
+    from app.utils.db_service import census_service
+    try:
+        # Rows are drawn batch by batch while the procedure cursor stays open
+        batches = census_service.iter_activity_log(table, operation, user, days)
+        with closing(batches):
+            print_table_streaming(itertools.chain.from_iterable(batches),
+                                  f"Activity Log - Last {days} days", max_rows)
+
+    except Exception as e:
+        print_error(f"Error retrieving activity log: {e}")
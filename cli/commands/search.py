@@ -0,0 +1,58 @@
+# =========================================
+# SEARCH COMMANDS
+# Census Database Management System - Oracle Edition
+# =========================================
+
+import click
+
+from cli.utils import CensusGroup, print_error, print_info, print_table_streaming
+
+@click.group(cls=CensusGroup)
+def search():
+    """Search census data"""
+    pass
+
+@search.command()
+@click.option('--region', help='Region name')
+@click.option('--district', help='District name')
+@click.option('--sex', type=click.Choice(['M', 'F']), help='Sex (M/F)')
+@click.option('--min-age', type=int, help='Minimum age')
+@click.option('--max-age', type=int, help='Maximum age')
+@click.option('--marital-status', help='Marital status')
+@click.option('--education', help='Education level')
+@click.option('--page', default=1, help='Page number')
+@click.option('--size', default=20, help='Page size')
+@click.option('--after-id', type=int, help='Continue after this individual ID (next page token)')
+@click.option('--show-total', is_flag=True, help='Also count every match (slower on large tables)')
+@click.option('--max-rows', default=1000, help='Rows to display (0 for all)')
+def individuals(region, district, sex, min_age, max_age, marital_status, education, page, size, after_id, show_total, max_rows):
+    """Search individuals with filters"""
+    from app.utils.db_service import census_service
+    from app.models.pydantic_models import SearchFilters, PaginationParams
+    try:
+        filters = SearchFilters(
+            region_name=region,
+            district_name=district,
+            sex=sex,  # click.Choice already limits it to the Sex values
+            min_age=min_age,
+            max_age=max_age,
+            marital_status=marital_status,
+            education_level=education
+        )
+
+        # Seek past the previous page when a token is given; OFFSET paging otherwise
+        pagination = PaginationParams(page=page, size=size, after_id=after_id)
+        data, has_next, total_count = census_service.search_individuals_page(
+            filters, pagination, include_total=show_total
+        )
+
+        if total_count is not None:
+            print_info(f"Found {total_count} individuals matching criteria")
+            if after_id is None:
+                print_info(f"Showing page {page} of {(total_count + size - 1) // size}")
+        print_table_streaming(data, "Search Results - Individuals", max_rows)
+        if has_next:
+            print_info(f"Next page: --after-id {data[-1]['individual_id']}")
+
+    except Exception as e:
+        print_error(f"Error searching individuals: {e}")
@@ -0,0 +1,209 @@
+# =========================================
+# CLI SHARED HELPERS
+# Census Database Management System - Oracle Edition
+# =========================================
+
+import click
+import sys
+import os
+import functools
+import hashlib
+import importlib
+import itertools
+import tempfile
+import time
+from typing import Any, Dict, List
+from rich.console import Console
+
+# Initialize rich console
+console = Console()
+
+# Streamed tables are redrawn after this many new rows
+STREAM_REFRESH_ROWS = 200
+
+# Listings longer than this ask before rendering on a terminal, and are
+# refused outright past the hard cap
+CONFIRM_TABLE_ROWS = 1000
+MAX_TABLE_ROWS = 10000
+
+@functools.lru_cache(maxsize=None)
+def type_adapter(tp):
+    """Validator for a model or type, built once on first use"""
+    from pydantic import TypeAdapter
+    return TypeAdapter(tp)
+
+def print_success(message):
+    """Print success message"""
+    console.print(f"✅ {message}", style="green")
+
+def print_error(message):
+    """Print error message"""
+    console.print(f"❌ {message}", style="red")
+
+def print_info(message):
+    """Print info message"""
+    console.print(f"ℹ️  {message}", style="blue")
+
+def print_table(data, title=None):
+    """Print data as a formatted table"""
+    if not data:
+        print_info("No data found")
+        return
+
+    if isinstance(data, list) and len(data) > 0:
+        from rich.table import Table
+
+        # Create table
+        table = Table(title=title)
+
+        # Add columns
+        if isinstance(data[0], dict):
+            for key in data[0].keys():
+                table.add_column(str(key), style="cyan")
+
+            # Add rows; dates and decimals are converted to text by pydantic-core
+            from pydantic_core import PydanticSerializationError
+            try:
+                rows = type_adapter(List[Dict[str, Any]]).dump_python(data, mode='json')
+            except PydanticSerializationError:
+                rows = data  # e.g. unread LOBs; fall back to str() per cell
+            for row in rows:
+                table.add_row(*[str(v) if v is not None else "" for v in row.values()])
+
+        console.print(table)
+    else:
+        console.print(data)
+
+def print_rows(columns, rows, title=None):
+    """Print tuple rows under a header as a formatted table"""
+    if not rows:
+        print_info("No data found")
+        return
+
+    from rich.table import Table
+
+    table = Table(title=title)
+    for column in columns:
+        table.add_column(str(column), style="cyan")
+    for row in rows:
+        table.add_row(*[str(v) if v is not None else "" for v in row])
+
+    console.print(table)
+
+def safe_print_table(rows, title=None, hard_cap=MAX_TABLE_ROWS, confirm_at=CONFIRM_TABLE_ROWS,
+                     hint="narrow the filters"):
+    """Print a listing, refusing huge ones and confirming large ones interactively"""
+    if len(rows) > hard_cap:
+        print_error(f"{len(rows)} rows is too many to render (limit {hard_cap}); {hint}")
+        return
+    if len(rows) > confirm_at and console.is_terminal:
+        if not click.confirm(f"Render {len(rows)} rows?", default=False):
+            return
+    print_table(rows, title)
+
+def print_table_streaming(rows, title=None, max_rows=1000):
+    """Print rows as a table while they arrive, stopping after max_rows (0 for no limit)"""
+    from rich.live import Live
+    from rich.table import Table
+
+    rows = iter(rows)
+    first = next(rows, None)
+    if first is None:
+        print_info("No data found")
+        return
+
+    table = Table(title=title)
+    for key in first.keys():
+        table.add_column(str(key), style="cyan")
+
+    shown = 0
+    truncated = False
+    with Live(table, console=console, auto_refresh=False) as live:
+        for row in itertools.chain([first], rows):
+            if max_rows and shown == max_rows:
+                truncated = True
+                break
+            table.add_row(*[str(v) if v is not None else "" for v in row.values()])
+            shown += 1
+            if shown % STREAM_REFRESH_ROWS == 0:
+                live.refresh()
+    if not console.is_terminal:
+        console.line()  # Live only ends the last line itself on a terminal
+
+    if truncated:
+        print_info("… more rows not shown; raise --max-rows (0 shows all)")
+
+# =========================================
+# CONNECTION PROBE
+# =========================================
+
+def _probe_stamp(settings) -> str:
+    """Path of the file stamped after a successful probe, one per DSN/user"""
+    # Each CLI run is a fresh process, so the probe result has to live on disk
+    key = f"{settings.ORACLE_USERNAME}@{settings.oracle_dsn}".encode()
+    return os.path.join(tempfile.gettempdir(), "census_cli_probe_" + hashlib.sha1(key).hexdigest()[:12])
+
+def probe() -> bool:
+    """Test the connection unless a run within CLI_PROBE_TTL seconds already succeeded"""
+    from config.oracle_config import settings
+
+    stamp = _probe_stamp(settings)
+    try:
+        if time.time() - os.path.getmtime(stamp) < settings.CLI_PROBE_TTL:
+            return True
+    except OSError:
+        pass
+
+    from app.database.oracle_connection import connection_manager
+    if not connection_manager.test_connection():
+        return False
+
+    try:
+        with open(stamp, "a"):
+            pass
+        os.utime(stamp)
+    except OSError:
+        pass
+    return True
+
+# =========================================
+# COMMAND CLASSES
+# =========================================
+
+class DatabaseCommand(click.Command):
+    """Command that checks the database connection just before it runs"""
+
+    def invoke(self, ctx):
+        # Test database connection
+        try:
+            if not probe():
+                print_error("Database connection failed. Please check your configuration.")
+                sys.exit(1)
+        except Exception as e:
+            print_error(f"Database connection error: {e}")
+            sys.exit(1)
+        return super().invoke(ctx)
+
+class CensusGroup(click.Group):
+    """Group whose subgroups and commands default to DatabaseCommand"""
+    command_class = DatabaseCommand
+    group_class = type
+
+class LazyGroup(CensusGroup):
+    """Group that imports a subcommand's module only when the subcommand is looked up
+
+    lazy_subcommands maps a command name to the module defining an attribute of that name.
+    """
+
+    def __init__(self, *args, lazy_subcommands=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.lazy_subcommands = lazy_subcommands or {}
+
+    def list_commands(self, ctx):
+        return sorted([*super().list_commands(ctx), *self.lazy_subcommands])
+
+    def get_command(self, ctx, cmd_name):
+        if cmd_name in self.lazy_subcommands:
+            module = importlib.import_module(self.lazy_subcommands[cmd_name])
+            return getattr(module, cmd_name)
+        return super().get_command(ctx, cmd_name)
@@ -5,7 +5,8 @@
 # =========================================
 
 import os
-from typing import Optional
+from functools import cached_property, lru_cache
+from typing import List, Optional
 from pydantic_settings import BaseSettings
 
 class OracleSettings(BaseSettings):
@@ -20,10 +21,16 @@ class OracleSettings(BaseSettings):
     ORACLE_PASSWORD: str = "census_password"
 
     # Connection Pool Settings
-    ORACLE_POOL_SIZE: int = 5
-    ORACLE_MAX_OVERFLOW: int = 10
-    ORACLE_POOL_TIMEOUT: int = 30
+    ORACLE_POOL_SIZE: int = 5  # Sessions opened at startup
+    ORACLE_MAX_OVERFLOW: int = 20  # Extra sessions the pool may grow by
+    ORACLE_POOL_INCREMENT: int = 5  # Sessions opened at a time when growing
+    ORACLE_POOL_TIMEOUT: int = 30  # Seconds to wait for a free session before failing
     ORACLE_POOL_RECYCLE: int = 3600
+    ORACLE_STMT_CACHE_SIZE: int = 100
+    ORACLE_FETCH_ARRAYSIZE: int = 1000  # Rows fetched per round-trip on every cursor
+    ORACLE_CURRENT_SCHEMA: Optional[str] = None  # Schema owning the census objects, if not the login user
+    ORACLE_HEALTH_CHECK_TTL: int = 5  # Seconds a connection test result is reused
+    CLI_PROBE_TTL: int = 30  # Seconds a successful CLI connection probe is trusted across runs
 
     # Application Settings
     APP_NAME: str = "Census DBMS"
@@ -34,6 +41,23 @@ class OracleSettings(BaseSettings):
     API_HOST: str = "0.0.0.0"
     API_PORT: int = 8000
     API_RELOAD: bool = True
+    API_WORKERS: int = 1  # Used when API_RELOAD is off
+    API_LOOP: str = "uvloop"  # Set to "asyncio" where uvloop is unavailable (Windows)
+    API_HTTP: str = "httptools"
+    API_BACKLOG: int = 2048
+    API_LIMIT_CONCURRENCY: int = 1000
+    API_KEEPALIVE_TIMEOUT: int = 75  # Seconds; outlive typical load balancer idle timeouts
+    ALLOWED_ORIGINS: List[str] = [
+        "http://localhost:3000",
+        "http://localhost:8000",
+        "http://localhost:8501",
+    ]
+
+    # Cache Settings
+    REDIS_URL: Optional[str] = None  # e.g. redis://localhost:6379/0; caching is off when unset
+    ANALYTICS_CACHE_TTL: int = 300  # Seconds a cached analytics response is served
+    CACHE_DIR: Optional[str] = None  # e.g. /var/cache/census; persistent result cache is off when unset
+    RESULT_CACHE_TTL: int = 300  # Seconds a persisted read result is reused
 
     # Security Settings
     SECRET_KEY: str = "your-secret-key-here-change-in-production"
@@ -43,7 +67,7 @@ class OracleSettings(BaseSettings):
         env_file = ".env"
         case_sensitive = True
 
-    @property
+    @cached_property
     def oracle_url(self) -> str:
         """Generate Oracle database URL"""
         if self.ORACLE_SERVICE_NAME:
@@ -51,7 +75,7 @@ class OracleSettings(BaseSettings):
         else:
             return f"oracle+oracledb://{self.ORACLE_USERNAME}:{self.ORACLE_PASSWORD}@{self.ORACLE_HOST}:{self.ORACLE_PORT}/{self.ORACLE_SID}"
 
-    @property
+    @cached_property
     def oracle_dsn(self) -> str:
         """Generate Oracle DSN for direct connections"""
         if self.ORACLE_SERVICE_NAME:
@@ -59,8 +83,13 @@ class OracleSettings(BaseSettings):
         else:
             return f"{self.ORACLE_HOST}:{self.ORACLE_PORT}/{self.ORACLE_SID}"
 
+@lru_cache
+def get_settings() -> OracleSettings:
+    """Return the settings, reading the environment and .env file only once"""
+    return OracleSettings()
+
 # Global settings instance
-settings = OracleSettings()
+settings = get_settings()
 
 # Database connection parameters for direct Oracle connections (oracledb format)
 ORACLE_CONFIG = {
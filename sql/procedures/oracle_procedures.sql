@@ -574,24 +574,21 @@ CREATE OR REPLACE PROCEDURE SP_GET_REGIONAL_STATISTICS (
     p_cursor OUT SYS_REFCURSOR
 ) AS
 BEGIN
+    -- Pre-aggregated by MV_REGIONAL_STATISTICS (refreshed by JOB_REFRESH_ANALYTICS_MVS)
     OPEN p_cursor FOR
         SELECT 
-            g.region_name,
-            g.district_name,
-            COUNT(DISTINCT h.household_id) as total_households,
-            COUNT(i.individual_id) as total_population,
-            SUM(CASE WHEN i.sex = 'M' THEN 1 ELSE 0 END) as total_males,
-            SUM(CASE WHEN i.sex = 'F' THEN 1 ELSE 0 END) as total_females,
-            ROUND(AVG(i.age), 2) as average_age,
-            COUNT(CASE WHEN e.engaged_in_economic_activity = 'Y' THEN 1 END) as employed_count,
-            COUNT(CASE WHEN i.highest_education_level IS NOT NULL THEN 1 END) as educated_count
-        FROM GEOGRAPHICAL_INFO g
-        JOIN HOUSEHOLD h ON g.geo_id = h.geo_id
-        LEFT JOIN INDIVIDUAL i ON h.household_id = i.household_id
-        LEFT JOIN ECONOMIC_ACTIVITY e ON i.individual_id = e.individual_id
-        WHERE (p_region_name IS NULL OR g.region_name = p_region_name)
-        GROUP BY g.region_name, g.district_name
-        ORDER BY g.region_name, g.district_name;
+            region_name,
+            district_name,
+            total_households,
+            total_population,
+            total_males,
+            total_females,
+            average_age,
+            employed_count,
+            educated_count
+        FROM MV_REGIONAL_STATISTICS
+        WHERE (p_region_name IS NULL OR region_name = p_region_name)
+        ORDER BY region_name, district_name;
 
     DBMS_OUTPUT.PUT_LINE('Regional statistics cursor opened for region: ' || NVL(p_region_name, 'ALL'));
 EXCEPTION
@@ -607,23 +604,20 @@ CREATE OR REPLACE PROCEDURE SP_GET_HOUSING_CONDITIONS (
     p_cursor OUT SYS_REFCURSOR
 ) AS
 BEGIN
+    -- Pre-aggregated by MV_HOUSING_CONDITIONS (refreshed by JOB_REFRESH_ANALYTICS_MVS)
     OPEN p_cursor FOR
         SELECT 
-            g.region_name,
-            g.district_name,
-            hs.dwelling_type,
-            hs.main_drinking_water_source,
-            hs.toilet_facility_type,
-            hs.main_lighting_source,
-            COUNT(*) as household_count,
-            ROUND(AVG(hs.rooms_occupied), 2) as avg_rooms_occupied
-        FROM HOUSING hs
-        JOIN HOUSEHOLD h ON hs.household_id = h.household_id
-        JOIN GEOGRAPHICAL_INFO g ON h.geo_id = g.geo_id
-        WHERE (p_district_name IS NULL OR g.district_name = p_district_name)
-        GROUP BY g.region_name, g.district_name, hs.dwelling_type, 
-                 hs.main_drinking_water_source, hs.toilet_facility_type, hs.main_lighting_source
-        ORDER BY g.region_name, g.district_name, household_count DESC;
+            region_name,
+            district_name,
+            dwelling_type,
+            main_drinking_water_source,
+            toilet_facility_type,
+            main_lighting_source,
+            household_count,
+            avg_rooms_occupied
+        FROM MV_HOUSING_CONDITIONS
+        WHERE (p_district_name IS NULL OR district_name = p_district_name)
+        ORDER BY region_name, district_name, household_count DESC;
 
     DBMS_OUTPUT.PUT_LINE('Housing conditions cursor opened for district: ' || NVL(p_district_name, 'ALL'));
 EXCEPTION
@@ -688,6 +682,8 @@ BEGIN
         WHERE (p_table_name IS NULL OR table_name = p_table_name)
           AND (p_operation_type IS NULL OR operation_type = p_operation_type)
           AND (p_user_name IS NULL OR user_name = p_user_name)
+          -- Coarse day-bucket range first, exact cut-off only matters on the oldest day
+          AND log_day_bucket >= TRUNC(SYSDATE) - p_days_back
           AND operation_timestamp >= SYSDATE - p_days_back
         ORDER BY operation_timestamp DESC;
 EXCEPTION
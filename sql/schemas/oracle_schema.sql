@@ -8,6 +8,21 @@
 -- CREATE TABLESPACE CENSUS_DATA 
 -- DATAFILE 'census_data.dbf' SIZE 100M AUTOEXTEND ON;
 
+-- Drop analytics materialized views and the maintenance jobs if they exist
+BEGIN
+    FOR j IN (SELECT job_name FROM user_scheduler_jobs WHERE job_name IN (
+        'JOB_REFRESH_ANALYTICS_MVS', 'JOB_GATHER_CENSUS_STATS'
+    )) LOOP
+        DBMS_SCHEDULER.DROP_JOB(j.job_name, force => TRUE);
+    END LOOP;
+    FOR m IN (SELECT mview_name FROM user_mviews WHERE mview_name IN (
+        'MV_REGIONAL_STATISTICS', 'MV_HOUSING_CONDITIONS'
+    )) LOOP
+        EXECUTE IMMEDIATE 'DROP MATERIALIZED VIEW ' || m.mview_name;
+    END LOOP;
+END;
+/
+
 -- Drop tables in reverse dependency order if they exist
 BEGIN
     FOR t IN (SELECT table_name FROM user_tables WHERE table_name IN (
@@ -147,6 +162,8 @@ CREATE INDEX idx_individual_household ON INDIVIDUAL(household_id);
 CREATE INDEX idx_individual_sex ON INDIVIDUAL(sex);
 CREATE INDEX idx_individual_age ON INDIVIDUAL(age);
 CREATE INDEX idx_individual_status ON INDIVIDUAL(status_on_census_night);
+CREATE INDEX idx_individual_marital ON INDIVIDUAL(marital_status);
+CREATE INDEX idx_individual_education ON INDIVIDUAL(highest_education_level);
 
 -- =========================================
 -- 4. HOUSING CONDITIONS TABLE
@@ -363,7 +380,9 @@ CREATE TABLE ACTIVITY_LOG (
     session_id VARCHAR2(100),
     ip_address VARCHAR2(50),
     operation_timestamp TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-    application_name VARCHAR2(100) DEFAULT 'CENSUS_DBMS'
+    application_name VARCHAR2(100) DEFAULT 'CENSUS_DBMS',
+    -- Day bucket of operation_timestamp; lets date-range reads seek whole days
+    log_day_bucket DATE GENERATED ALWAYS AS (TRUNC(operation_timestamp)) VIRTUAL
 );
 
 -- Create indexes for activity log
@@ -371,6 +390,24 @@ CREATE INDEX idx_activity_log_table ON ACTIVITY_LOG(table_name);
 CREATE INDEX idx_activity_log_operation ON ACTIVITY_LOG(operation_type);
 CREATE INDEX idx_activity_log_timestamp ON ACTIVITY_LOG(operation_timestamp);
 CREATE INDEX idx_activity_log_user ON ACTIVITY_LOG(user_name);
+CREATE INDEX idx_activity_log_day ON ACTIVITY_LOG(log_day_bucket);
+
+-- =========================================
+-- 12. DATA VERSION TABLE (change counters behind the API's ETags)
+-- =========================================
+-- Bumped by statement triggers inside each writing transaction. The row lock
+-- orders concurrent writers, so committed versions follow commit order.
+CREATE TABLE DATA_VERSION (
+    table_name VARCHAR2(100) PRIMARY KEY,
+    version NUMBER DEFAULT 0 NOT NULL
+);
+
+INSERT INTO DATA_VERSION (table_name)
+SELECT column_value FROM TABLE(sys.odcivarchar2list(
+    'GEOGRAPHICAL_INFO', 'HOUSEHOLD', 'INDIVIDUAL', 'HOUSING',
+    'ECONOMIC_ACTIVITY', 'FERTILITY', 'MORTALITY'
+));
+COMMIT;
 
 -- =========================================
 -- CREATE VIEWS FOR COMMON QUERIES
@@ -449,6 +486,86 @@ FROM HOUSING hs
 JOIN HOUSEHOLD h ON hs.household_id = h.household_id
 JOIN GEOGRAPHICAL_INFO g ON h.geo_id = g.geo_id;
 
+-- =========================================
+-- MATERIALIZED VIEWS FOR ANALYTICS
+-- =========================================
+-- Pre-aggregated results read by SP_GET_REGIONAL_STATISTICS and
+-- SP_GET_HOUSING_CONDITIONS. COUNT(DISTINCT) and outer-joined AVG are not
+-- fast-refreshable, and ON COMMIT refresh would serialize every census write
+-- behind the aggregation, so both are rebuilt on a schedule instead.
+
+CREATE MATERIALIZED VIEW MV_REGIONAL_STATISTICS
+BUILD IMMEDIATE
+REFRESH COMPLETE ON DEMAND
+AS
+SELECT 
+    g.region_name,
+    g.district_name,
+    COUNT(DISTINCT h.household_id) as total_households,
+    COUNT(i.individual_id) as total_population,
+    SUM(CASE WHEN i.sex = 'M' THEN 1 ELSE 0 END) as total_males,
+    SUM(CASE WHEN i.sex = 'F' THEN 1 ELSE 0 END) as total_females,
+    ROUND(AVG(i.age), 2) as average_age,
+    COUNT(CASE WHEN e.engaged_in_economic_activity = 'Y' THEN 1 END) as employed_count,
+    COUNT(CASE WHEN i.highest_education_level IS NOT NULL THEN 1 END) as educated_count
+FROM GEOGRAPHICAL_INFO g
+JOIN HOUSEHOLD h ON g.geo_id = h.geo_id
+LEFT JOIN INDIVIDUAL i ON h.household_id = i.household_id
+LEFT JOIN ECONOMIC_ACTIVITY e ON i.individual_id = e.individual_id
+GROUP BY g.region_name, g.district_name;
+
+CREATE INDEX idx_mv_regional_region ON MV_REGIONAL_STATISTICS(region_name, district_name);
+
+CREATE MATERIALIZED VIEW MV_HOUSING_CONDITIONS
+BUILD IMMEDIATE
+REFRESH COMPLETE ON DEMAND
+AS
+SELECT 
+    g.region_name,
+    g.district_name,
+    hs.dwelling_type,
+    hs.main_drinking_water_source,
+    hs.toilet_facility_type,
+    hs.main_lighting_source,
+    COUNT(*) as household_count,
+    ROUND(AVG(hs.rooms_occupied), 2) as avg_rooms_occupied
+FROM HOUSING hs
+JOIN HOUSEHOLD h ON hs.household_id = h.household_id
+JOIN GEOGRAPHICAL_INFO g ON h.geo_id = g.geo_id
+GROUP BY g.region_name, g.district_name, hs.dwelling_type, 
+         hs.main_drinking_water_source, hs.toilet_facility_type, hs.main_lighting_source;
+
+CREATE INDEX idx_mv_housing_district ON MV_HOUSING_CONDITIONS(district_name);
+
+-- Refresh both views every five minutes (atomic_refresh keeps readers on the old rows)
+BEGIN
+    DBMS_SCHEDULER.CREATE_JOB(
+        job_name        => 'JOB_REFRESH_ANALYTICS_MVS',
+        job_type        => 'PLSQL_BLOCK',
+        job_action      => 'BEGIN DBMS_MVIEW.REFRESH(''MV_REGIONAL_STATISTICS,MV_HOUSING_CONDITIONS'', ''CC'', atomic_refresh => TRUE); END;',
+        start_date      => SYSTIMESTAMP,
+        repeat_interval => 'FREQ=MINUTELY;INTERVAL=5',
+        enabled         => TRUE,
+        comments        => 'Refresh census analytics materialized views'
+    );
+END;
+/
+
+-- Gather optimizer statistics nightly; USER_TABLES.NUM_ROWS backs the
+-- estimated row counts shown on the statistics dashboards
+BEGIN
+    DBMS_SCHEDULER.CREATE_JOB(
+        job_name        => 'JOB_GATHER_CENSUS_STATS',
+        job_type        => 'PLSQL_BLOCK',
+        job_action      => 'BEGIN DBMS_STATS.GATHER_SCHEMA_STATS(USER); END;',
+        start_date      => SYSTIMESTAMP,
+        repeat_interval => 'FREQ=DAILY;BYHOUR=2',
+        enabled         => TRUE,
+        comments        => 'Refresh census table statistics'
+    );
+END;
+/
+
 -- =========================================
 -- GRANT PERMISSIONS (adjust as needed)
 -- =========================================
@@ -577,3 +577,58 @@ COMPOUND TRIGGER
     END AFTER STATEMENT;
 END TRG_HOUSEHOLD_STATS_UPDATE;
 /
+
+-- =========================================
+-- DATA VERSION TRIGGERS
+-- =========================================
+-- Bump the table's DATA_VERSION row once per writing statement, in the same
+-- transaction, so the API's ETags change in commit order
+
+CREATE OR REPLACE TRIGGER TRG_GEOGRAPHICAL_INFO_VERSION
+    AFTER INSERT OR UPDATE OR DELETE ON GEOGRAPHICAL_INFO
+BEGIN
+    UPDATE DATA_VERSION SET version = version + 1 WHERE table_name = 'GEOGRAPHICAL_INFO';
+END TRG_GEOGRAPHICAL_INFO_VERSION;
+/
+
+CREATE OR REPLACE TRIGGER TRG_HOUSEHOLD_VERSION
+    AFTER INSERT OR UPDATE OR DELETE ON HOUSEHOLD
+BEGIN
+    UPDATE DATA_VERSION SET version = version + 1 WHERE table_name = 'HOUSEHOLD';
+END TRG_HOUSEHOLD_VERSION;
+/
+
+CREATE OR REPLACE TRIGGER TRG_INDIVIDUAL_VERSION
+    AFTER INSERT OR UPDATE OR DELETE ON INDIVIDUAL
+BEGIN
+    UPDATE DATA_VERSION SET version = version + 1 WHERE table_name = 'INDIVIDUAL';
+END TRG_INDIVIDUAL_VERSION;
+/
+
+CREATE OR REPLACE TRIGGER TRG_HOUSING_VERSION
+    AFTER INSERT OR UPDATE OR DELETE ON HOUSING
+BEGIN
+    UPDATE DATA_VERSION SET version = version + 1 WHERE table_name = 'HOUSING';
+END TRG_HOUSING_VERSION;
+/
+
+CREATE OR REPLACE TRIGGER TRG_ECONOMIC_ACTIVITY_VERSION
+    AFTER INSERT OR UPDATE OR DELETE ON ECONOMIC_ACTIVITY
+BEGIN
+    UPDATE DATA_VERSION SET version = version + 1 WHERE table_name = 'ECONOMIC_ACTIVITY';
+END TRG_ECONOMIC_ACTIVITY_VERSION;
+/
+
+CREATE OR REPLACE TRIGGER TRG_FERTILITY_VERSION
+    AFTER INSERT OR UPDATE OR DELETE ON FERTILITY
+BEGIN
+    UPDATE DATA_VERSION SET version = version + 1 WHERE table_name = 'FERTILITY';
+END TRG_FERTILITY_VERSION;
+/
+
+CREATE OR REPLACE TRIGGER TRG_MORTALITY_VERSION
+    AFTER INSERT OR UPDATE OR DELETE ON MORTALITY
+BEGIN
+    UPDATE DATA_VERSION SET version = version + 1 WHERE table_name = 'MORTALITY';
+END TRG_MORTALITY_VERSION;
+/
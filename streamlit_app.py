@@ -1,5 +1,4 @@
 import streamlit as st
-import pandas as pd
 import os
 from datetime import date
 
@@ -26,12 +25,53 @@ def get_db_service():
 
 service = get_db_service()
 
+# Rows shown per window in the Data Management tables
+PREVIEW_ROWS = 1000
+
+def preview_offset(key):
+    """Row offset picked for a Data Management table"""
+    return st.number_input("Start at row", min_value=0, step=PREVIEW_ROWS, value=0, key=key,
+                           help=f"Tables show {PREVIEW_ROWS} rows at a time")
+
+def rows_frame(rows):
+    """Build a DataFrame straight from database row dicts, columns taken from the first row"""
+    import pandas as pd  # Only pages that show a table pay for the import
+    return pd.DataFrame.from_records(rows, columns=list(rows[0]) if rows else None)
+
+# --- Cached Panels ---
+# Every widget interaction reruns the script; these keep reruns off the database
+@st.cache_data(ttl=60, show_spinner=False)
+def cached_database_statistics():
+    return service.get_database_statistics()
+
+@st.cache_data(ttl=60, show_spinner=False)
+def cached_recent_individuals():
+    return service.get_individuals(
+        limit=10, columns=["individual_id", "full_name", "sex", "age", "household_id"]
+    )
+
+@st.cache_data(ttl=60, show_spinner=False)
+def cached_regional_statistics(region):
+    return service.get_regional_statistics(region)
+
+@st.cache_data(ttl=60, show_spinner=False)
+def cached_housing_conditions(district):
+    return service.get_housing_conditions(district)
+
+@st.cache_data(ttl=30, show_spinner=False)
+def cached_activity_log(table_name, operation_type, days_back):
+    return service.get_activity_log(
+        table_name=table_name, operation_type=operation_type, days_back=days_back
+    )
+
 # --- UI Layout ---
 st.set_page_config(page_title="Census DBMS", layout="wide")
 st.title("📊 Census Database Management System")
 
 st.sidebar.title("Navigation")
 page = st.sidebar.radio("Go to", ["Dashboard", "Data Management", "Analytics & Reporting", "Search", "Activity Log"])
+if st.sidebar.button("🔄 Refresh"):
+    st.cache_data.clear()
 
 # --- Page: Dashboard ---
 if page == "Dashboard":
@@ -39,7 +79,7 @@ if page == "Dashboard":
     st.markdown("An overview of the census data.")
 
     try:
-        stats = service.get_database_statistics()
+        stats = cached_database_statistics()
         col1, col2, col3 = st.columns(3)
         with col1:
             st.metric(label="Total Individuals", value=stats.get('TOTAL_INDIVIDUALS', 0))
@@ -51,7 +91,7 @@ if page == "Dashboard":
         st.divider()
         
         st.subheader("Recent Individuals")
-        recent_individuals_df = pd.DataFrame(service.get_individuals(limit=10))
+        recent_individuals_df = rows_frame(cached_recent_individuals())
         st.dataframe(recent_individuals_df, use_container_width=True)
 
     except Exception as e:
@@ -100,7 +140,7 @@ elif page == "Data Management":
             
             # Read
             st.subheader("View Individuals")
-            individuals_df = pd.DataFrame(service.get_individuals())
+            individuals_df = service.get_individuals_frame(PREVIEW_ROWS, preview_offset("individuals_offset"))
             st.dataframe(individuals_df, use_container_width=True)
 
     elif entity_type == "Households":
@@ -126,7 +166,7 @@ elif page == "Data Management":
                         st.error(f"Error creating household: {e}")
     
             st.subheader("View Households")
-            households_df = pd.DataFrame(service.get_households())
+            households_df = service.get_households_frame(PREVIEW_ROWS, preview_offset("households_offset"))
             st.dataframe(households_df, use_container_width=True)
 
     elif entity_type == "Geographical Info":
@@ -154,7 +194,7 @@ elif page == "Data Management":
                         st.error(f"Error creating region: {e}")
     
             st.subheader("View Geographical Info")
-            geo_df = pd.DataFrame(service.get_geographical_info())
+            geo_df = service.get_geographical_info_frame(PREVIEW_ROWS, preview_offset("geo_offset"))
             st.dataframe(geo_df, use_container_width=True)
 
 # --- Page: Analytics & Reporting ---
@@ -167,9 +207,9 @@ elif page == "Analytics & Reporting":
         st.subheader("Regional Statistics")
         try:
             region = st.text_input("Filter by Region Name (optional)")
-            data = service.get_regional_statistics(region if region else None)
+            data = cached_regional_statistics(region if region else None)
             if data:
-                df = pd.DataFrame(data)
+                df = rows_frame(data)
                 st.bar_chart(df.set_index('REGION_NAME')[['TOTAL_POPULATION', 'TOTAL_MALES', 'TOTAL_FEMALES']])
                 st.dataframe(df, use_container_width=True)
             else:
@@ -184,7 +224,7 @@ elif page == "Analytics & Reporting":
             try:
                 data = service.get_household_demographics(household_id)
                 if data:
-                    df = pd.DataFrame(data)
+                    df = rows_frame(data)
                     st.dataframe(df, use_container_width=True)
                 else:
                     st.info("No data available for this household.")
@@ -195,9 +235,9 @@ elif page == "Analytics & Reporting":
         st.subheader("Housing Conditions by District")
         try:
             district = st.text_input("Filter by District Name (optional)")
-            data = service.get_housing_conditions(district if district else None)
+            data = cached_housing_conditions(district if district else None)
             if data:
-                df = pd.DataFrame(data)
+                df = rows_frame(data)
                 st.dataframe(df, use_container_width=True)
             else:
                 st.info("No data available for this report.")
@@ -216,29 +256,48 @@ elif page == "Search":
         max_age = st.number_input("Max Age", min_value=0, max_value=150, value=150)
         marital_status = st.selectbox("Marital Status", ["", "Single", "Married", "Divorced", "Widowed", "Separated"])
         
-        page_num = st.number_input("Page", min_value=1, value=1)
         page_size = st.number_input("Results per page", min_value=1, max_value=100, value=20)
+        show_total = st.checkbox("Show total count (slower on large tables)")
 
         search_submitted = st.form_submit_button("Search")
 
     if search_submitted:
+        # A new search starts at the first page; Next/Previous then seek by key
+        st.session_state.search_filters = SearchFilters(
+            region_name=region_name or None,
+            district_name=district_name or None,
+            sex=sex or None,
+            min_age=min_age,
+            max_age=max_age,
+            marital_status=marital_status or None
+        )
+        st.session_state.search_after_ids = [None]  # Cursor of every page visited so far
+
+    if "search_filters" in st.session_state:
         try:
-            filters = SearchFilters(
-                region_name=region_name or None,
-                district_name=district_name or None,
-                sex=sex or None,
-                min_age=min_age,
-                max_age=max_age,
-                marital_status=marital_status or None
-            )
-            pagination = PaginationParams(page=page_num, size=page_size)
+            after_ids = st.session_state.search_after_ids
+            pagination = PaginationParams(size=page_size, after_id=after_ids[-1])
             
-            results, total_count = service.search_individuals(filters, pagination)
+            # One extra row is fetched to tell whether a next page exists
+            results, has_next, total_count = service.search_individuals_page(
+                st.session_state.search_filters, pagination, include_total=show_total
+            )
             
-            st.success(f"Found {total_count} individuals. Displaying page {page_num}.")
+            if total_count is not None:
+                st.success(f"Found {total_count} individuals. Displaying page {len(after_ids)}.")
+            else:
+                st.success(f"Displaying page {len(after_ids)}.")
             if results:
-                results_df = pd.DataFrame(results)
+                results_df = rows_frame(results)
                 st.dataframe(results_df, use_container_width=True)
+
+                previous_col, next_col = st.columns(2)
+                if len(after_ids) > 1 and previous_col.button("Previous page"):
+                    after_ids.pop()
+                    st.rerun()
+                if has_next and next_col.button("Next page"):
+                    after_ids.append(results[-1]["individual_id"])
+                    st.rerun()
             else:
                 st.info("No individuals found matching your criteria.")
         except Exception as e:
@@ -255,13 +314,9 @@ elif page == "Activity Log":
 
     if st.button("Fetch Logs"):
         try:
-            logs = service.get_activity_log(
-                table_name=table_name or None,
-                operation_type=operation_type or None,
-                days_back=days_back
-            )
+            logs = cached_activity_log(table_name or None, operation_type or None, days_back)
             if logs:
-                log_df = pd.DataFrame(logs)
+                log_df = rows_frame(logs)
                 st.dataframe(log_df, use_container_width=True)
             else:
                 st.info("No activity logs found for the selected criteria.")